@@ -6,15 +6,17 @@ from flask import Flask
 from flask_wtf.csrf import CSRFProtect
 
 
-def create_app():
+def create_app(testing=False):
     app = Flask(__name__)
     app.config.from_object('config.config.Config')
+    if testing:
+        app.config['TESTING'] = True
 
     # Initialize CSRF protection
     csrf = CSRFProtect(app)
 
-    # Configure logging
-    if not app.debug:
+    # Configure logging (tests log to stderr only)
+    if not app.debug and not app.testing:
         # Ensure logs directory exists
         log_dir = os.path.dirname(app.config['LOG_FILE'])
         if not os.path.exists(log_dir):
@@ -40,14 +40,15 @@ def generate_har():
         assessments = OHASParser.parse_from_table(summary_table)
 
         # Generate HARs
-        results = []
-        for assessment in assessments:
-            har = engine.process_assessment(assessment)
-            results.append({
+        hars = engine.process_batch(assessments)
+        results = [
+            {
                 'assessment_id': assessment.id,
                 'category': assessment.category.value,
                 'har_text': har.to_text()
-            })
+            }
+            for assessment, har in zip(assessments, hars)
+        ]
 
         return jsonify({'success': True, 'hars': results})
 
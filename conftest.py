@@ -0,0 +1,101 @@
+"""
+Shared pytest fixtures for HAR Automation tests.
+
+Fixtures defined here are available to every test_*.py module in the
+repository root.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.parser import SchemaLoader
+from src.pipeline import DecisionEngine
+
+
+@pytest.fixture(scope="session")
+def decision_engine():
+    """
+    Decision engine built from the hazard rules schema, once per test session.
+
+    Returns:
+        DecisionEngine: Engine shared by all tests (it holds no per-assessment state)
+    """
+    loader = SchemaLoader()
+    return DecisionEngine(loader.load())
+
+
+# OHAS "Hazard Assessment" page copied from the browser: one assessment
+_OHAS_SINGLE_TEXT = """Hazard Assessment
+Displaying 1-1 of 1 result.
+Assessment
+Category
+Feature Type
+Location
+Active Fault
+Liquefaction
+Landslide
+Tsunami
+Nearest Active Volcano
+Nearest Potentially Active Volcano
+Fissure
+Lahar
+Pyroclastic Flow
+Base Surge
+Lava Flow
+Ballistic Projectile
+Volcanic Tsunami
+
+24916    Earthquake    Polygon    121.073821,14.600733    Safe; Approximately 35 meters west of the Valley Fault System: West Valley Fault    --    --    --    --    --    --    --    --    --    --    --    --
+No Files Attached
+"""
+
+# Same page with two assessments (earthquake + volcano)
+_OHAS_MULTI_TEXT = """Hazard Assessment
+Displaying 1-2 of 2 results.
+Assessment
+Category
+Feature Type
+Location
+Active Fault
+Liquefaction
+Landslide
+Tsunami
+Nearest Active Volcano
+Nearest Potentially Active Volcano
+Fissure
+Lahar
+Pyroclastic Flow
+Base Surge
+Lava Flow
+Ballistic Projectile
+Volcanic Tsunami
+
+24777    Earthquake    Polygon    125.083337,11.772125    Safe; Approximately 458 meters west of the Central Samar Fault: Paranas Segment    Safe    Least to Highly Susceptible; Within the depositional zone    Safe    --    --    --    --    --    --    --    --    --
+24778    Volcano    Polygon    125.072479,11.788131    --    --    --    --    Approximately 67.7 kilometers east of Biliran Volcano    Approximately 85.4 km northeast of Cancajanag Volcano    --    Safe    Safe    --    Safe    --    --
+"""
+
+
+@pytest.fixture(scope="session")
+def ohas_single_text():
+    """
+    OHAS native format text with a single earthquake assessment.
+
+    Returns:
+        str: Text as copied from the OHAS browser page
+    """
+    return _OHAS_SINGLE_TEXT
+
+
+@pytest.fixture(scope="session")
+def ohas_multi_text():
+    """
+    OHAS native format text with two assessments (earthquake + volcano).
+
+    Returns:
+        str: Text as copied from the OHAS browser page
+    """
+    return _OHAS_MULTI_TEXT
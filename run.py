@@ -1,6 +1,14 @@
+import os
+
 from app import create_app
 
 app = create_app()
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    app.run(
+        debug=True,
+        host='0.0.0.0',
+        port=int(os.environ.get('PORT', 5000)),
+        # RELOAD=0 runs a single process (no reloader child), e.g. for tests
+        use_reloader=os.environ.get('RELOAD', '1') != '0'
+    )
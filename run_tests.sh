@@ -138,7 +138,7 @@ run_quick_tests() {
 
     # Run only critical tests
     .venv/bin/python3 -m pytest test_e2e.py -v --tb=short \
-        -k "test_server_health or test_earthquake_har or test_volcano_har or test_csrf_protection_missing"
+        -k "test_server_health or test_har_generation or test_csrf_protection_missing"
 
     if [ $? -eq 0 ]; then
         print_success "Quick tests passed!"
@@ -157,7 +157,14 @@ run_parallel() {
         .venv/bin/pip install -q pytest-xdist
     fi
 
-    .venv/bin/python3 -m pytest test_e2e.py -v --tb=short -n auto "$@"
+    # Leave 2 cores for the Flask servers and the OS
+    local workers=$(( $(nproc) - 2 ))
+    if [ "$workers" -lt 1 ]; then
+        workers=1
+    fi
+
+    # loadgroup keeps tests that share a server on the same worker
+    .venv/bin/python3 -m pytest test_e2e.py -v --tb=short -n "$workers" --dist loadgroup "$@"
 
     if [ $? -eq 0 ]; then
         print_success "All tests passed!"
@@ -1,6 +1,7 @@
 """Assessment input data models"""
 
-from dataclasses import dataclass
+import hashlib
+from dataclasses import astuple, dataclass
 from typing import Optional
 from enum import Enum
 
@@ -99,6 +100,17 @@ class Assessment:
     volcano: Optional[VolcanoAssessment] = None
     vicinity_map_provided: bool = False
 
+    def fingerprint(self) -> str:
+        """
+        Digest of every field, for keying cached outputs.
+
+        Returns:
+            Hex BLAKE2b digest; equal assessments share a fingerprint
+        """
+        return hashlib.blake2b(
+            repr(astuple(self)).encode('utf-8'), digest_size=16
+        ).hexdigest()
+
     def has_earthquake_assessment(self) -> bool:
         """Check if earthquake assessment data exists"""
         return self.earthquake is not None
@@ -1,11 +1,16 @@
 """HAR output data models"""
 
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Optional
 from .assessment import AssessmentCategory
 
+# dataclass(slots=True) needs Python 3.10+; older runtimes get regular instances
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
 class ExplanationRecommendation:
     """
     Explanation and Recommendation as a paired unit.
@@ -14,6 +19,9 @@ class ExplanationRecommendation:
     paragraphs - they form a single cohesive text block where the
     recommendation immediately follows the explanation.
 
+    Instances are immutable and canonicalized by from_parts, so identical
+    statements are a single shared instance across HAR outputs.
+
     Example:
         "Ground rupture hazard assessment is the distance to the nearest
         known active fault. The recommended buffer zone, or Zone of Avoidance,
@@ -53,19 +61,33 @@ class ExplanationRecommendation:
             ... )
             ExplanationRecommendation(text="Ground shaking and liquefaction hazards can be mitigated...")
         """
-        parts = []
-        if explanation:
-            parts.append(explanation)
-        if recommendation:
-            parts.append(recommendation)
+        return _canonical_from_parts(explanation, recommendation)
+
+
+def _join_parts(explanation: Optional[str], recommendation: Optional[str]) -> str:
+    """Join non-empty explanation/recommendation parts with a space."""
+    parts = []
+    if explanation:
+        parts.append(explanation)
+    if recommendation:
+        parts.append(recommendation)
+
+    if not parts:
+        raise ValueError("Must provide at least explanation or recommendation")
+
+    return " ".join(parts)
 
-        if not parts:
-            raise ValueError("Must provide at least explanation or recommendation")
 
-        return cls(text=" ".join(parts))
+@lru_cache(maxsize=512)
+def _canonical_from_parts(
+    explanation: Optional[str],
+    recommendation: Optional[str]
+) -> ExplanationRecommendation:
+    """Shared ExplanationRecommendation instance per (explanation, recommendation)."""
+    return ExplanationRecommendation(text=_join_parts(explanation, recommendation))
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class HARSection:
     """
     A hazard section in the HAR.
@@ -102,7 +124,7 @@ class HARSection:
         return f"{number}. {self.heading}: {self.assessment}. {self.explanation_recommendation.text}"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class HAROutput:
     """Complete HAR output for a single assessment"""
     category: AssessmentCategory
@@ -31,6 +31,29 @@ class HazardRule:
     conditions: Dict[str, HazardCondition] = field(default_factory=dict)
     special_cases: Optional[Dict[str, Any]] = None
     applies_to: Optional[List[str]] = None
+    # special_cases keyed by lowercased name (built once, see get_special_case)
+    _special_cases_lc: Dict[str, Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        """Index special cases by lowercased key for case-insensitive lookup"""
+        if self.special_cases:
+            self._special_cases_lc = {
+                key.lower(): value for key, value in self.special_cases.items()
+            }
+
+    def get_special_case(self, key: str) -> Any:
+        """
+        Look up a special case by name, ignoring case.
+
+        Args:
+            key: Special case name (e.g. volcano name "Mayon" or "mayon")
+
+        Returns:
+            Special case config, or None if the rule has no such case
+        """
+        return self._special_cases_lc.get(key.lower())
 
     def has_explanation(self) -> bool:
         """Check if rule has an explanation"""
@@ -49,6 +72,8 @@ class HazardRulesSchema:
     volcano_rules: Dict[str, HazardRule]
     decision_logic: Dict[str, List[str]]
     fuzzy_logic_parameters: Dict[str, Any]
+    # Digest of the schema file this was loaded from ('' if built in memory)
+    source_hash: str = field(default='', compare=False)
 
     @classmethod
     def from_dict(cls, data: dict) -> 'HazardRulesSchema':
@@ -1,6 +1,8 @@
 """Schema loader for hazard rules"""
 
+import hashlib
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from ..models import HazardRulesSchema
@@ -11,6 +13,36 @@ class SchemaValidationError(Exception):
     pass
 
 
+@lru_cache(maxsize=8)
+def _read_schema(schema_path: str, mtime_ns: int) -> HazardRulesSchema:
+    """
+    Read, validate and parse a schema file.
+
+    Cached on (path, modification time) so repeated loads of an unchanged
+    file (tests, app start-up, scripts) parse the JSON only once; editing
+    the file changes the key and forces a fresh parse. A few entries are
+    kept so loaders for different schema paths don't evict each other.
+
+    Args:
+        schema_path: Path to schema JSON file
+        mtime_ns: File modification time in nanoseconds (cache key only)
+
+    Returns:
+        HazardRulesSchema object, with source_hash set from the file bytes
+    """
+    with open(schema_path, 'rb') as f:
+        raw = f.read()
+    data = json.loads(raw.decode('utf-8'))
+
+    # Validate basic structure
+    SchemaLoader._validate_structure(data)
+
+    # Parse into structured objects
+    schema = HazardRulesSchema.from_dict(data)
+    schema.source_hash = hashlib.blake2b(raw).hexdigest()[:16]
+    return schema
+
+
 class SchemaLoader:
     """
     Load and validate hazard rules schema.
@@ -51,15 +83,45 @@ class SchemaLoader:
                 f"Schema file not found: {self.schema_path}"
             )
 
-        try:
-            with open(self.schema_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+        return self._load(cached=True)
 
-            # Validate basic structure
-            self._validate_structure(data)
+    def load_schema(self, schema_path) -> HazardRulesSchema:
+        """
+        Load schema from an explicit path.
 
-            # Parse into structured objects
-            schema = HazardRulesSchema.from_dict(data)
+        Repeated calls for the same unchanged file return the same parsed
+        object without re-reading it.
+
+        Args:
+            schema_path: Path to schema JSON file (str or Path)
+
+        Returns:
+            HazardRulesSchema object
+
+        Raises:
+            FileNotFoundError: If schema file doesn't exist
+            SchemaValidationError: If schema structure is invalid
+        """
+        self.schema_path = Path(schema_path)
+        return self.load()
+
+    def _load(self, cached: bool) -> HazardRulesSchema:
+        """
+        Load schema, optionally bypassing the parsed-schema cache.
+
+        Args:
+            cached: Reuse a previous parse of the unchanged file if available
+
+        Returns:
+            HazardRulesSchema object
+
+        Raises:
+            SchemaValidationError: If schema structure is invalid
+        """
+        try:
+            mtime_ns = self.schema_path.stat().st_mtime_ns
+            read = _read_schema if cached else _read_schema.__wrapped__
+            schema = read(str(self.schema_path), mtime_ns)
 
             self._schema = schema
             return schema
@@ -73,7 +135,8 @@ class SchemaLoader:
                 f"Error loading schema: {str(e)}"
             ) from e
 
-    def _validate_structure(self, data: dict) -> None:
+    @staticmethod
+    def _validate_structure(data: dict) -> None:
         """
         Validate that schema has required top-level keys.
 
@@ -142,9 +205,14 @@ class SchemaLoader:
 
     def reload(self) -> HazardRulesSchema:
         """
-        Reload schema from file.
+        Reload schema from file, bypassing the parsed-schema cache.
 
         Returns:
             HazardRulesSchema object
         """
-        return self.load()
+        if not self.schema_path.exists():
+            raise FileNotFoundError(
+                f"Schema file not found: {self.schema_path}"
+            )
+
+        return self._load(cached=False)
@@ -12,6 +12,17 @@ from ..models import (
 )
 
 
+# Data rows in OHAS text start with the numeric assessment ID
+_OHAS_ROW_RE = re.compile(r'^\d+\s+')
+_OHAS_ID_RE = re.compile(r'^\d+')
+# OHAS separates columns with runs of spaces or tabs
+_OHAS_FIELD_SPLIT_RE = re.compile(r'\s{2,}|\t')
+# Markdown separator rows: |----|:---:|
+_MD_SEPARATOR_RE = re.compile(r'^\|\s*[-:]+\s*(\|\s*[-:]+\s*)*\|$')
+# Markdown links in headers: [Text](url)
+_MD_LINK_RE = re.compile(r'\[([^\]]+)\]\([^\)]+\)')
+
+
 class TableParseError(Exception):
     """Exception raised when table parsing fails"""
     pass
@@ -158,7 +169,7 @@ class TableParser:
             line = lines[i]
 
             # Check if this line is a data row (starts with digits)
-            if re.match(r'^\d+\s+', line):
+            if _OHAS_ROW_RE.match(line):
                 data_start_idx = i
                 break
 
@@ -178,12 +189,12 @@ class TableParser:
                 break
 
             # Skip empty or non-data lines
-            if not re.match(r'^\d+', line):
+            if not _OHAS_ID_RE.match(line):
                 continue
 
             # Split by multiple spaces or tabs (OHAS uses multiple spaces as separators)
             # This is tricky - need to handle "Safe; Approximately 35 meters..." as one field
-            values = re.split(r'\s{2,}|\t', line)
+            values = _OHAS_FIELD_SPLIT_RE.split(line)
 
             # Build row data
             if len(values) >= len(headers):
@@ -220,7 +231,7 @@ class TableParser:
         for i, line in enumerate(lines):
             if line.startswith('|') and line.endswith('|'):
                 # Skip separator rows (|----|----| etc)
-                if re.match(r'^\|\s*[-:]+\s*(\|\s*[-:]+\s*)*\|$', line):
+                if _MD_SEPARATOR_RE.match(line):
                     continue
                 if header_line is None:
                     header_line = line
@@ -240,7 +251,7 @@ class TableParser:
             if not line.startswith('|'):
                 continue
             # Skip separator rows
-            if re.match(r'^\|\s*[-:]+\s*(\|\s*[-:]+\s*)*\|$', line):
+            if _MD_SEPARATOR_RE.match(line):
                 continue
 
             values = [v.strip() for v in line.split('|')[1:-1]]
@@ -268,12 +279,17 @@ class TableParser:
         headers = lines[0].split('\t')
         headers = TableParser._clean_headers(headers)
 
+        # Resolve canonical field names once per table, not once per row
+        fields = [TableParser._normalize_field_name(header) for header in headers]
+
         # Parse data rows
         assessments = []
         for line in lines[1:]:
             values = line.split('\t')
-            row_data = dict(zip(headers, values))
-            assessment = TableParser._parse_row_data(row_data)
+            normalized = {
+                field: value for field, value in zip(fields, values) if field
+            }
+            assessment = TableParser._build_assessment(normalized)
             if assessment:
                 assessments.append(assessment)
 
@@ -320,7 +336,7 @@ class TableParser:
         cleaned = []
         for header in headers:
             # Remove markdown links: [Text](url) → Text
-            header = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', header)
+            header = _MD_LINK_RE.sub(r'\1', header)
             # Remove extra whitespace
             header = ' '.join(header.split())
             # Lowercase
@@ -366,6 +382,19 @@ class TableParser:
             if canonical:
                 normalized[canonical] = value
 
+        return TableParser._build_assessment(normalized)
+
+    @staticmethod
+    def _build_assessment(normalized: Dict[str, str]) -> Optional[Assessment]:
+        """
+        Build an Assessment from row data keyed by canonical field names.
+
+        Args:
+            normalized: Dictionary of canonical field name → value
+
+        Returns:
+            Assessment object or None if invalid
+        """
         # Extract required fields
         assessment_id = normalized.get('assessment')
         if not assessment_id:
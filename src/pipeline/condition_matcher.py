@@ -1,8 +1,12 @@
 """Condition matcher for matching assessment statuses to schema conditions"""
 
+import re
 from typing import Dict, Optional
 from ..models import HazardCondition
 
+# Pinatubo lahar zone number in a lowercased status, e.g. "zone 3"
+_ZONE_RE = re.compile(r"zone\s+([1-5])")
+
 
 class ConditionMatchError(Exception):
     """Exception raised when condition matching fails"""
@@ -124,8 +128,7 @@ class ConditionMatcher:
         # Pinatubo lahar zones
         if "zone" in status_lower:
             # Extract zone number if present
-            import re
-            zone_match = re.search(r"zone\s+([1-5])", status_lower)
+            zone_match = _ZONE_RE.search(status_lower)
             if zone_match:
                 zone_num = zone_match.group(1)
                 return f"zone_{zone_num}"
@@ -229,8 +232,7 @@ class ConditionMatcher:
         # Pinatubo: Zone-based
         if "pinatubo" in volcano_lower:
             if "zone" in status_lower:
-                import re
-                zone_match = re.search(r"zone\s+([1-5])", status_lower)
+                zone_match = _ZONE_RE.search(status_lower)
                 if zone_match:
                     return f"zone_{zone_match.group(1)}"
             # Default to safe if no zone specified
@@ -1,18 +1,453 @@
 """Decision engine for HAR generation"""
 
+import logging
 import re
-from typing import List, Optional
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
 from ..models import (
     Assessment,
     AssessmentCategory,
+    HazardRule,
     HazardRulesSchema,
     HARSection,
     HAROutput,
     ExplanationRecommendation,
+    VolcanoAssessment,
 )
 from .condition_matcher import ConditionMatcher
 
 
+# PDZ decision tracing (enable DEBUG on "<module>.pdz" to follow _process_pdz)
+_pdz_log = logging.getLogger(__name__).getChild('pdz')
+
+# Placeholder used in OHAS tables for "not assessed"
+_DASH = "--"
+
+# Statuses that mean a hazard was not assessed for the site
+_EMPTY_STATUSES = frozenset((None, "", _DASH))
+
+# Nearest active volcano text, e.g. "Approximately 58.3 km north of Taal
+# Volcano" or "Approximately 67.7 kilometers east of Biliran Volcano"
+_VOLCANO_RE = re.compile(
+    r"Approximately\s+([\d.]+)\s*(?:km|kilometers)\s+(\w+)\s+of\s+(.+?)\s+Volcano",
+    re.IGNORECASE
+)
+
+# Leading "Mount"/"Mt." that is not part of a volcano's canonical name
+_MOUNT_PREFIX_RE = re.compile(r'(?:mount|mt\.?)\s+', re.IGNORECASE)
+
+# Volcano name in nearest PAV text, e.g. "Approximately 15.8 kilometers
+# northeast of Labo Volcano" (last "of" before "Volcano")
+_PAV_RE = re.compile(r'.*\bof\s+(?P<name>.+?)\s+Volcano')
+
+# Volcano name leading a PAV classification, e.g. "Corregidor Volcano is ..."
+_PAV_PREFIX_RE = re.compile(r'\s*(?P<name>.*?)\s*Volcano')
+
+# Exact "Safe" statuses, checked before falling back to classification
+_SAFE_LITERALS = frozenset(("Safe", "safe", "SAFE"))
+
+# Pinatubo lahar zone numbers
+_PINATUBO_ZONES = ('1', '2', '3', '4', '5')
+
+# Pinatubo lahar zone in a status, e.g. "Prone; Zone 3"
+_ZONE_RE = re.compile(r'Zone\s+([1-5])', re.IGNORECASE)
+
+# Status keyword flags (bitmask) used by the avoidance check
+_FLAG_PRONE = 1
+_FLAG_SUSCEPTIBLE = 2
+_FLAG_WITHIN = 4
+_FLAG_SAFE = 8
+
+# Proximity hazard fields and the keyword flags that warrant avoidance, most
+# often prone first so the per-row check can return early: in the validation
+# tables lahar and PDC carry every avoidance hit, lava flow and ballistic none
+_AVOIDANCE_FLAGS = (
+    ('lahar', _FLAG_PRONE | _FLAG_SUSCEPTIBLE),
+    ('pyroclastic_flow', _FLAG_PRONE | _FLAG_SUSCEPTIBLE | _FLAG_WITHIN),
+    ('lava_flow', _FLAG_PRONE | _FLAG_WITHIN),
+    ('ballistic_projectile', _FLAG_PRONE | _FLAG_WITHIN),
+)
+
+
+# Status fields of every hazard section besides PDZ (all empty -> no sections)
+_SECTION_STATUS_FIELDS = (
+    'lahar',
+    'pyroclastic_flow',
+    'lava_flow',
+    'ballistic_projectile',
+    'base_surge',
+    'volcanic_tsunami',
+    'fissure',
+)
+
+
+@lru_cache(maxsize=256)
+def _classify_status(status: str) -> int:
+    """
+    Classify a hazard status string into keyword flags.
+
+    OHAS statuses come from a small vocabulary, so the cache hit rate is
+    near 100% after the first few assessments.
+
+    Args:
+        status: Hazard status text (e.g. "Prone; Highly Prone")
+
+    Returns:
+        Bitmask of _FLAG_* values found in the status (case-insensitive)
+    """
+    status_lower = status.lower()
+    flags = 0
+    if 'prone' in status_lower:
+        flags |= _FLAG_PRONE
+    if 'susceptible' in status_lower:
+        flags |= _FLAG_SUSCEPTIBLE
+    if 'within' in status_lower:
+        flags |= _FLAG_WITHIN
+    if 'safe' in status_lower:
+        flags |= _FLAG_SAFE
+    return flags
+
+
+# Fallback ashfall statement when the schema has no common ashfall template
+_DEFAULT_ASHFALL_TEMPLATE = (
+    "In case of future eruptions of {volcano_name} Volcano and other nearby volcanoes, "
+    "the site/s may be affected by tephra fall/ ashfall depending on the height of the eruption plume "
+    "and prevailing wind direction at the time of eruption."
+)
+
+# Distance-based safety statement added to common statements (> 50 km)
+_DISTANCE_SAFE_STATEMENT = ExplanationRecommendation.from_parts(
+    explanation=(
+        "Considering the distance of the site from the volcano, the site is safe from "
+        "volcanic hazards such as pyroclastic density currents, lava flows, and ballistic "
+        "projectiles that may originate from the volcano."
+    )
+)
+
+# Explanation for the standalone distance-based safety section
+_DISTANCE_SAFE_SECTION_EXP_REC = ExplanationRecommendation.from_parts(
+    explanation=(
+        "Considering the distance of the site/s from the volcano, "
+        "the site/s is/are safe from volcanic hazards such as "
+        "pyroclastic density currents, lava flows, and ballistic "
+        "projectiles that may originate from the volcano."
+    )
+)
+
+# Avoidance text used when the schema has no PDC recommendation
+_DEFAULT_AVOIDANCE = ExplanationRecommendation.from_parts(
+    recommendation=(
+        "Avoidance is recommended for site/sites that may potentially be affected by "
+        "pyroclastic density currents (PDCs) and lava flows."
+    )
+)
+
+# Supersedes statements for single-site and multi-site HARs
+_SUPERSEDES_SINGLE = (
+    "This assessment supersedes all previous reports "
+    "issued for this site."
+)
+_SUPERSEDES_MULTI = (
+    "This assessment supersedes all previous reports "
+    "issued for these sites."
+)
+
+# HazardHunterPH / GeoAnalyticsPH pointers appended to every HAR
+_ADDITIONAL_RECOMMENDATIONS = (
+    (
+        "For more information on geohazards in the Philippines, "
+        "please visit HazardHunterPH (https://hazardhunter.georisk.gov.ph/) "
+        "and GeoAnalyticsPH (https://geoanalytics.georisk.gov.ph/)."
+    ),
+)
+
+# PDZ section text; {radius} is the whole-kilometer radius
+_PDZ_INSIDE_STATUS = (
+    "Within PDZ; The site is within the {radius}-kilometer radius Permanent Danger Zone"
+)
+_PDZ_OUTSIDE_STATUS = (
+    "Outside PDZ; The site is outside the {radius}-kilometer radius Permanent Danger Zone"
+)
+_PDZ_OUTSIDE_TEXT = (
+    "The Permanent Danger Zone (PDZ) is a zone that can always be affected by "
+    "small-scale eruptions of {volcano_name} Volcano. Human settlement is not "
+    "recommended within the PDZ. The site is outside the {radius}-kilometer "
+    "radius Permanent Danger Zone of the volcano."
+)
+
+# Sites farther than this (km) from the volcano are safe from proximity hazards
+_DISTANCE_SAFE_KM = 50.0
+
+# Most distinct volcano names whose resolved config an engine remembers
+_VOLCANO_CONFIG_CACHE_SIZE = 256
+
+# Most (volcano name, radius, inside) PDZ sections an engine remembers
+_PDZ_SECTION_CACHE_SIZE = 512
+
+# Mayon lahar (status label, schema zone key) pairs, in match order
+_MAYON_ZONES = (
+    ("Highly Prone", "highly_prone"),
+    ("Moderately Prone", "moderately_prone"),
+    ("Least Prone", "least_prone"),
+)
+
+
+@lru_cache(maxsize=64)
+def _is_taal(volcano_name: str) -> bool:
+    """
+    Check whether a volcano name refers to Taal (case-insensitive).
+
+    Args:
+        volcano_name: Name of volcano
+
+    Returns:
+        True for Taal, which has base surge and fissure special cases
+    """
+    return "taal" in volcano_name.lower()
+
+
+def _is_safe_status(status: str) -> bool:
+    """
+    Check whether a hazard status marks the site as safe (case-insensitive).
+
+    Args:
+        status: Non-empty hazard status text
+
+    Returns:
+        True if the status contains "safe"
+    """
+    return status in _SAFE_LITERALS or bool(_classify_status(status) & _FLAG_SAFE)
+
+
+@lru_cache(maxsize=64)
+def _build_nearest_statement(volcano_name: str) -> ExplanationRecommendation:
+    """
+    Build the nearest active volcano statement for a volcano.
+
+    Args:
+        volcano_name: Name of volcano
+
+    Returns:
+        ExplanationRecommendation naming the nearest volcano (shared, immutable)
+    """
+    return ExplanationRecommendation.from_parts(
+        explanation=f"{volcano_name} Volcano is the nearest identified active volcano to the site."
+    )
+
+
+@lru_cache(maxsize=64)
+def _build_ashfall_statement(
+    template_parts: Tuple[str, ...],
+    volcano_name: str
+) -> ExplanationRecommendation:
+    """
+    Build the ashfall statement for a volcano.
+
+    Args:
+        template_parts: Ashfall template split on "{volcano_name}"
+        volcano_name: Name of volcano
+
+    Returns:
+        ExplanationRecommendation for ashfall (shared, immutable)
+    """
+    # Substitute volcano name into the pre-split template
+    explanation = volcano_name.join(template_parts)
+
+    return ExplanationRecommendation.from_parts(
+        explanation=explanation
+    )
+
+
+@lru_cache(maxsize=64)
+def _build_pav_statement(pav_text: str) -> ExplanationRecommendation:
+    """
+    Build the PAV statement from the nearest PAV text.
+
+    Args:
+        pav_text: Text from assessment.volcano.nearest_pav
+
+    Returns:
+        ExplanationRecommendation for PAV (shared, immutable)
+    """
+    # Extract volcano name from text
+    # Format: "Approximately 15.8 kilometers northeast of Labo Volcano"
+    match = _PAV_RE.match(pav_text)
+    volcano_name = match.group('name').strip() if match else "Unknown"
+
+    # Standard PAV explanation (exact wording from official HARs)
+    explanation = (
+        f"{volcano_name} Volcano is currently classified by DOST-PHIVOLCS as a "
+        f"potentially active volcano, which is morphologically young-looking but with "
+        f"no historical or analytical records of eruption, therefore, its eruptive and "
+        f"hazard potential is yet to be determined."
+    )
+
+    return ExplanationRecommendation.from_parts(explanation=explanation)
+
+
+@lru_cache(maxsize=256)
+def _canonical_volcano_name(name: str) -> str:
+    """Lowercased volcano name without a leading "Mount"/"Mt." (e.g. "mayon")."""
+    match = _MOUNT_PREFIX_RE.match(name)
+    return (name[match.end():] if match else name).lower()
+
+
+@lru_cache(maxsize=256)
+def _parse_volcano_text(text: str) -> Tuple[float, str, str, str]:
+    """
+    Parse nearest active volcano text (cached per text).
+
+    Both process_volcano_assessment and _process_pdz need the parse, and
+    the same few volcano texts recur across a batch of sites.
+
+    Args:
+        text: Nearest active volcano text
+
+    Returns:
+        Tuple of (distance in km, direction, volcano name, canonical name);
+        falls back to (0.0, 'unknown', 'Unknown Volcano', 'unknown volcano')
+        if the text does not match
+
+    Raises:
+        TypeError: If text is not a string
+    """
+    match = _VOLCANO_RE.search(text)
+    if match:
+        name = match.group(3)
+        return float(match.group(1)), match.group(2), name, _canonical_volcano_name(name)
+    return 0.0, 'unknown', 'Unknown Volcano', 'unknown volcano'
+
+
+def _parse_distances(texts: List[Optional[str]]) -> List[Optional[float]]:
+    """
+    Extract distances from many nearest active volcano texts in one pass.
+
+    Args:
+        texts: Nearest active volcano texts (None where not available)
+
+    Returns:
+        Distance in km per text (0.0 if unparseable, None if text is None),
+        matching _parse_nearest_volcano
+    """
+    return [
+        None if text is None else _parse_volcano_text(text)[0]
+        for text in texts
+    ]
+
+
+def _has_section_statuses_batch(
+    volcanoes: List[Optional[VolcanoAssessment]]
+) -> List[bool]:
+    """
+    Flag the rows with any hazard status that could produce a section.
+
+    Rows where every status in _SECTION_STATUS_FIELDS is empty or "--" get
+    no section besides PDZ, so process_volcano_assessment can skip them.
+
+    Args:
+        volcanoes: Volcano assessment data per row (None rows have no statuses)
+
+    Returns:
+        True per row with at least one assessed status, in input order
+    """
+    has_statuses = [False] * len(volcanoes)
+    for attr in _SECTION_STATUS_FIELDS:
+        column = [
+            getattr(volcano, attr) if volcano is not None else None
+            for volcano in volcanoes
+        ]
+        for index, status in enumerate(column):
+            if status not in _EMPTY_STATUSES:
+                has_statuses[index] = True
+    return has_statuses
+
+
+def _classify_pdz(
+    distances: List[Optional[float]],
+    radii: List[Optional[float]]
+) -> List[Optional[bool]]:
+    """
+    Classify many sites as inside or outside their volcano's PDZ.
+
+    Args:
+        distances: Distance in km per site (None if unknown)
+        radii: PDZ radius in km per site (None if the volcano has none)
+
+    Returns:
+        True (inside), False (outside) or None (not applicable) per site
+    """
+    return [
+        None if distance is None or radius is None else distance < radius
+        for distance, radius in zip(distances, radii)
+    ]
+
+
+@dataclass(frozen=True)
+class VolcanoConfig:
+    """
+    Per-volcano special-case data derived once from the schema.
+
+    Attributes:
+        name: Canonical volcano key as written in the schema (e.g. "Mayon")
+        pdz_radius_km: PDZ radius, or None if the volcano has no radius-based PDZ
+        lahar_zone_explanations: Pinatubo-style zone number -> combined explanation
+        lahar_prone_explanations: Mayon-style (status label, combined explanation)
+            pairs in match order; explanation is None if the schema lacks that level
+    """
+    name: str
+    pdz_radius_km: Optional[float] = None
+    lahar_zone_explanations: Dict[str, str] = field(default_factory=dict)
+    lahar_prone_explanations: Tuple[Tuple[str, Optional[str]], ...] = ()
+
+
+def _has_safe_literal(status: str) -> bool:
+    """Check for a capitalized "Safe" in a hazard status (case-sensitive)."""
+    return "Safe" in status
+
+
+@dataclass(frozen=True)
+class HazardSpec:
+    """
+    A volcano hazard whose section is the schema rule text, unmodified.
+
+    Attributes:
+        attr: VolcanoAssessment status field
+        rule_attr: DecisionEngine attribute holding the schema rule
+        heading: HAR section heading
+        is_safe: Predicate for statuses that get no section
+        taal_only: Only assessed for Taal
+    """
+    attr: str
+    rule_attr: str
+    heading: str
+    is_safe: Callable[[str], bool] = _is_safe_status
+    taal_only: bool = False
+
+
+# Rule-text hazards in HAR section order (after PDZ and lahar)
+_PDC_SPEC = HazardSpec(
+    'pyroclastic_flow', '_rule_pdc', "Pyroclastic Density Current",
+    is_safe=_has_safe_literal
+)
+_LAVA_FLOW_SPEC = HazardSpec('lava_flow', '_rule_lava_flow', "Lava Flow")
+_BALLISTIC_SPEC = HazardSpec(
+    'ballistic_projectile', '_rule_ballistic', "Ballistic Projectiles"
+)
+_BASE_SURGE_SPEC = HazardSpec(
+    'base_surge', '_rule_base_surge', "Base Surge", taal_only=True
+)
+_TSUNAMI_SPEC = HazardSpec('volcanic_tsunami', '_rule_tsunami', "Volcanic Tsunami")
+
+_HAZARD_SPECS = (
+    _PDC_SPEC,
+    _LAVA_FLOW_SPEC,
+    _BALLISTIC_SPEC,
+    _BASE_SURGE_SPEC,
+    _TSUNAMI_SPEC,
+)
+
+
 class DecisionEngine:
     """
     Core decision engine for generating HAR content.
@@ -31,6 +466,160 @@ class DecisionEngine:
         self.schema = schema
         self.matcher = ConditionMatcher()
 
+        # Resolve frequently used volcano rules once (schema is immutable)
+        volcano_rules = schema.volcano_rules
+        self._rule_pdz = volcano_rules.get('pdz_danger_zone')
+        self._rule_lahar = volcano_rules.get('lahar')
+        self._rule_lava_flow = volcano_rules.get('lava_flow')
+        self._rule_ballistic = volcano_rules.get('ballistic_projectiles')
+        self._rule_base_surge = volcano_rules.get('base_surge')
+        self._rule_tsunami = volcano_rules.get('volcanic_tsunami')
+        self._rule_fissure = volcano_rules.get('fissure')
+        self._rule_pdc = volcano_rules.get('pyroclastic_density_current')
+        self._rule_common = volcano_rules.get('common')
+        self._rule_distance = volcano_rules.get('distance_rules')
+
+        # Special-case templates (ashfall is stored in the common rule's raw dict)
+        # (a common rule with special cases but no ashfall template yields an
+        # empty statement, which raises ValueError when the statement is built)
+        if self._rule_common and self._rule_common.special_cases:
+            ashfall_data = self._rule_common.get_special_case('ashfall') or {}
+            ashfall_template = ashfall_data.get('template', '')
+        else:
+            ashfall_template = _DEFAULT_ASHFALL_TEMPLATE
+        # Split on the placeholder so substitution is a single join per call
+        self._ashfall_parts = tuple(ashfall_template.split('{volcano_name}'))
+
+        # Rule-text hazard sections are the rule's explanation/recommendation
+        # verbatim, so build each one once (None: no rule or no explanation)
+        self._hazard_exp_recs: Dict[str, Optional[ExplanationRecommendation]] = {}
+        for spec in _HAZARD_SPECS:
+            rule = getattr(self, spec.rule_attr)
+            self._hazard_exp_recs[spec.rule_attr] = (
+                ExplanationRecommendation.from_parts(
+                    explanation=rule.explanation,
+                    recommendation=rule.recommendation
+                )
+                if rule and rule.explanation else None
+            )
+
+        self._volcano_table = self._build_volcano_table()
+        # Resolved configs by volcano name as given, see _get_volcano_config
+        self._volcano_configs: Dict[str, Optional[VolcanoConfig]] = {}
+        # PDZ sections by (volcano name, radius, inside), see _pdz_section
+        self._pdz_sections: Dict[Tuple[str, float, bool], HARSection] = {}
+
+    def _build_volcano_table(self) -> Dict[str, VolcanoConfig]:
+        """
+        Precompute per-volcano PDZ and lahar special cases.
+
+        Keyed by lowercased volcano name so per-assessment processing is a
+        single dict lookup instead of re-walking the schema special cases.
+
+        Returns:
+            Dictionary of lowercased volcano name -> VolcanoConfig
+        """
+        pdz_rule = self._rule_pdz
+        lahar_rule = self._rule_lahar
+
+        names: Dict[str, str] = {}
+        for rule in (pdz_rule, lahar_rule):
+            for key in (rule.special_cases if rule else None) or ():
+                names.setdefault(key.lower(), key)
+
+        table: Dict[str, VolcanoConfig] = {}
+        for volcano_lower, name in names.items():
+            # PDZ radius (Taal has no radius, its PDZ is Volcano Island)
+            radius_km = None
+            pdz_config = pdz_rule.get_special_case(volcano_lower) if pdz_rule else None
+            if volcano_lower != 'taal' and isinstance(pdz_config, dict):
+                radius = pdz_config.get('radius_km')
+                # Numeric radii only, so distance comparisons cannot fail
+                if isinstance(radius, (int, float)):
+                    radius_km = float(radius)
+
+            zone_explanations: Dict[str, str] = {}
+            prone_explanations: Tuple[Tuple[str, Optional[str]], ...] = ()
+            lahar_config = lahar_rule.get_special_case(volcano_lower) if lahar_rule else None
+            if isinstance(lahar_config, dict):
+                intro = lahar_config.get('intro', '')
+                zones = lahar_config.get('zones', {})
+
+                def combined(zone_key: str) -> Optional[str]:
+                    zone_config = zones.get(zone_key)
+                    if zone_config and isinstance(zone_config, dict):
+                        zone_explanation = zone_config.get('explanation', '')
+                        if intro and zone_explanation:
+                            return f"{intro} {zone_explanation}"
+                    return None
+
+                if volcano_lower == 'pinatubo':
+                    # Pinatubo special case - 5 zones
+                    for zone_num in _PINATUBO_ZONES:
+                        explanation = combined(f'zone_{zone_num}')
+                        if explanation:
+                            zone_explanations[zone_num] = explanation
+                elif volcano_lower == 'mayon':
+                    # Mayon special case - prone levels
+                    prone_explanations = tuple(
+                        (label, combined(zone_key))
+                        for label, zone_key in _MAYON_ZONES
+                    )
+
+            table[volcano_lower] = VolcanoConfig(
+                name=name,
+                pdz_radius_km=radius_km,
+                lahar_zone_explanations=zone_explanations,
+                lahar_prone_explanations=prone_explanations,
+            )
+
+        return table
+
+    def _get_volcano_config(self, volcano_name: str) -> Optional[VolcanoConfig]:
+        """
+        Look up precomputed special-case config for a volcano.
+
+        Args:
+            volcano_name: Name of volcano (case-insensitive)
+
+        Returns:
+            VolcanoConfig or None if the volcano has no special cases
+        """
+        # PDZ and lahar processing both look up the same name per site, so
+        # lowercase and resolve each distinct name only once
+        try:
+            return self._volcano_configs[volcano_name]
+        except KeyError:
+            config = self._resolve_volcano_config(volcano_name)
+            if len(self._volcano_configs) < _VOLCANO_CONFIG_CACHE_SIZE:
+                self._volcano_configs[volcano_name] = config
+            return config
+
+    def _resolve_volcano_config(self, volcano_name: str) -> Optional[VolcanoConfig]:
+        """
+        Find the special-case config for a volcano name (uncached).
+
+        Args:
+            volcano_name: Name of volcano (case-insensitive)
+
+        Returns:
+            VolcanoConfig or None if the volcano has no special cases
+        """
+        volcano_lower = volcano_name.lower()
+        config = self._volcano_table.get(volcano_lower)
+        if config is None:
+            # "Mount Mayon" -> "mayon"
+            config = self._volcano_table.get(_canonical_volcano_name(volcano_name))
+        if config is not None:
+            return config
+
+        # Fall back to partial name matching (e.g. "Hibok" for "Hibok-Hibok")
+        for volcano_key, config in self._volcano_table.items():
+            if volcano_key in volcano_lower or volcano_lower in volcano_key:
+                return config
+
+        return None
+
     def process_assessment(self, assessment: Assessment) -> HAROutput:
         """
         Process assessment and generate HAR output.
@@ -51,6 +640,55 @@ class DecisionEngine:
         else:
             raise ValueError(f"Unknown assessment category: {assessment.category}")
 
+    def process_batch(self, assessments: List[Assessment]) -> List[HAROutput]:
+        """
+        Process multiple assessments (e.g. all rows of one summary table).
+
+        Equivalent to calling process_assessment for each assessment, with
+        the per-row dispatch hoisted out of the loop. Rule and per-volcano
+        statement lookups are already resolved at init or cached by volcano
+        name, so assessments for the same volcano share that work.
+
+        Args:
+            assessments: Assessments parsed from OHAS
+
+        Returns:
+            HAROutput for each assessment, in input order
+
+        Raises:
+            ValueError: If any assessment category is invalid or data is missing
+        """
+        earthquake = AssessmentCategory.EARTHQUAKE
+        volcano = AssessmentCategory.VOLCANO
+        process_earthquake = self.process_earthquake_assessment
+        process_volcano = self.process_volcano_assessment
+
+        # Classify all volcano rows up front, column by column: avoidance,
+        # and whether any hazard besides PDZ was assessed at all
+        volcano_rows = [
+            assessment.volcano for assessment in assessments
+            if assessment.category == volcano
+        ]
+        needs_avoidance = iter(self._check_needs_avoidance_batch(volcano_rows))
+        has_statuses = iter(_has_section_statuses_batch(volcano_rows))
+
+        outputs: List[HAROutput] = []
+        append = outputs.append
+        for assessment in assessments:
+            category = assessment.category
+            if category == earthquake:
+                append(process_earthquake(assessment))
+            elif category == volcano:
+                append(process_volcano(
+                    assessment,
+                    needs_avoidance=next(needs_avoidance),
+                    has_statuses=next(has_statuses)
+                ))
+            else:
+                raise ValueError(f"Unknown assessment category: {category}")
+
+        return outputs
+
     def process_earthquake_assessment(self, assessment: Assessment) -> HAROutput:
         """
         Process earthquake assessment following decision workflow.
@@ -107,7 +745,7 @@ class DecisionEngine:
         common = self._get_common_earthquake_statements()
 
         # 9. Supersedes statement
-        supersedes = self._get_supersedes_statement(single_site=True)
+        supersedes = _SUPERSEDES_SINGLE
 
         # Additional recommendations
         additional = self._get_additional_recommendations()
@@ -121,7 +759,12 @@ class DecisionEngine:
             additional_recommendations=additional
         )
 
-    def process_volcano_assessment(self, assessment: Assessment) -> HAROutput:
+    def process_volcano_assessment(
+        self,
+        assessment: Assessment,
+        needs_avoidance: Optional[bool] = None,
+        has_statuses: Optional[bool] = None
+    ) -> HAROutput:
         """
         Process volcano assessment following decision workflow.
 
@@ -144,6 +787,10 @@ class DecisionEngine:
 
         Args:
             assessment: Volcano assessment data
+            needs_avoidance: Precomputed avoidance check (from process_batch);
+                computed from the assessment if None
+            has_statuses: Whether any non-PDZ hazard status is assessed (from
+                process_batch); False skips straight past those hazards
 
         Returns:
             HAROutput for volcano hazards
@@ -164,24 +811,16 @@ class DecisionEngine:
 
         # Add "Biliran Volcano is the nearest identified active volcano to the site."
         if volcano_name != 'Unknown':
-            nearest_statement = ExplanationRecommendation.from_parts(
-                explanation=f"{volcano_name} Volcano is the nearest identified active volcano to the site."
-            )
-            common.append(nearest_statement)
+            common.append(_build_nearest_statement(volcano_name))
 
         # 3. Distance-based safety statement
-        # Check if site is safe from proximity hazards based on distance or hazard statuses
-        is_distance_safe = self._check_distance_based_safety(assessment, distance_km)
+        # Shown when site is > ~50-60km from volcano, independent of hazard
+        # statuses (HAS-Apr-25-14786 has it at 64.4km with Lahar "Prone").
+        # Using 50km as conservative threshold.
+        is_distance_safe = distance_km > _DISTANCE_SAFE_KM
 
         if is_distance_safe:
-            safety_statement = ExplanationRecommendation.from_parts(
-                explanation=(
-                    f"Considering the distance of the site from the volcano, the site is safe from "
-                    f"volcanic hazards such as pyroclastic density currents, lava flows, and ballistic "
-                    f"projectiles that may originate from the volcano."
-                )
-            )
-            common.append(safety_statement)
+            common.append(_DISTANCE_SAFE_STATEMENT)
 
         # 4-10. Process individual hazards (ONLY if not distance-safe)
         if not is_distance_safe:
@@ -190,36 +829,22 @@ class DecisionEngine:
             if pdz_section:
                 sections.append(pdz_section)
 
+        # Every other hazard needs an assessed status to produce a section
+        if not is_distance_safe and has_statuses is not False:
             # Lahar
             lahar_section = self._process_lahar(assessment, volcano_name)
             if lahar_section:
                 sections.append(lahar_section)
 
-            # Pyroclastic Flow
-            pdc_section = self._process_pyroclastic_flow(assessment)
-            if pdc_section:
-                sections.append(pdc_section)
-
-            # Lava Flow
-            lava_section = self._process_lava_flow(assessment)
-            if lava_section:
-                sections.append(lava_section)
-
-            # Ballistic Projectiles
-            ballistic_section = self._process_ballistic_projectiles(assessment)
-            if ballistic_section:
-                sections.append(ballistic_section)
-
-            # Base Surge (Taal only)
-            if "taal" in volcano_name.lower():
-                base_surge_section = self._process_base_surge(assessment)
-                if base_surge_section:
-                    sections.append(base_surge_section)
-
-            # Volcanic Tsunami (if assessed)
-            tsunami_section = self._process_volcanic_tsunami(assessment)
-            if tsunami_section:
-                sections.append(tsunami_section)
+            # Pyroclastic Flow, Lava Flow, Ballistic Projectiles,
+            # Base Surge (Taal only) and Volcanic Tsunami
+            is_taal = _is_taal(volcano_name)
+            for spec in _HAZARD_SPECS:
+                if spec.taal_only and not is_taal:
+                    continue
+                section = self._process_simple_hazard(assessment, spec)
+                if section:
+                    sections.append(section)
 
             # Fissure (if within 50km)
             fissure_section = self._process_fissure(assessment, volcano_name, distance_km)
@@ -229,7 +854,7 @@ class DecisionEngine:
         # 11. PAV (Potentially Active Volcano) - always include if present
         # Official HARs show PAV statements appear even when there's a nearby AV
         # (confirmed by HAS-Jul-24-12496, HAS-Jun-25-14462, etc.)
-        if assessment.volcano.nearest_pav and assessment.volcano.nearest_pav != "--":
+        if assessment.volcano.nearest_pav and assessment.volcano.nearest_pav != _DASH:
             pav_statement = self._get_pav_statement(assessment.volcano.nearest_pav)
             common.append(pav_statement)
 
@@ -238,12 +863,14 @@ class DecisionEngine:
         common.append(ashfall_statement)
 
         # 13. Avoidance recommendation (only if any hazard is prone)
-        if not is_distance_safe and self._check_needs_avoidance(assessment):
+        if needs_avoidance is None:
+            needs_avoidance = self._check_needs_avoidance(assessment)
+        if not is_distance_safe and needs_avoidance:
             avoidance = self._get_avoidance_recommendation()
             common.append(avoidance)
 
         # 14. Supersedes
-        supersedes = self._get_supersedes_statement(single_site=True)
+        supersedes = _SUPERSEDES_SINGLE
 
         # Additional recommendations
         additional = self._get_additional_recommendations()
@@ -420,26 +1047,18 @@ class DecisionEngine:
             assessment: Volcano assessment
 
         Returns:
-            Dictionary with distance, direction, and volcano name
-        """
-        text = assessment.volcano.nearest_active_volcano
-        # Accept both "km" and "kilometers"
-        pattern = r"Approximately\s+([\d.]+)\s*(?:km|kilometers)\s+(\w+)\s+of\s+(.+?)\s+Volcano"
-        match = re.search(pattern, text, re.IGNORECASE)
-
-        if match:
-            return {
-                'distance': float(match.group(1)),
-                'direction': match.group(2),
-                'name': match.group(3)
-            }
-        else:
-            # Fallback parsing
-            return {
-                'distance': 0.0,
-                'direction': 'unknown',
-                'name': 'Unknown Volcano'
-            }
+            Dictionary with distance, direction, volcano name, and canonical
+            name (lowercased, without "Mount"/"Mt.", e.g. "mayon")
+        """
+        distance, direction, name, canonical = _parse_volcano_text(
+            assessment.volcano.nearest_active_volcano
+        )
+        return {
+            'distance': distance,
+            'direction': direction,
+            'name': name,
+            'canonical': canonical
+        }
 
     def _process_pdz(self, assessment: Assessment, volcano_name: str) -> Optional[HARSection]:
         """
@@ -452,53 +1071,136 @@ class DecisionEngine:
         Returns:
             HARSection for PDZ or None if not applicable
         """
-        try:
-            # Get PDZ rule from schema
-            rule = self.schema.volcano_rules.get('pdz_danger_zone')
-            if not rule:
-                return None
-
-            # Case-insensitive volcano name matching
-            volcano_lower = volcano_name.lower()
-
-            # Check for special cases in schema
-            special_cases = rule.special_cases or {}
+        # Get PDZ rule from schema
+        rule = self._rule_pdz
+        if not rule:
+            _pdz_log.debug("No PDZ rule in schema")
+            return None
 
-            # Get radius from special cases or return None
-            radius_km = None
-            volcano_config = None
-
-            for volcano_key in special_cases:
-                if volcano_key.lower() in volcano_lower or volcano_lower in volcano_key.lower():
-                    volcano_config = special_cases[volcano_key]
-                    # Handle Taal special case (no radius, just explanation)
-                    if volcano_key.lower() == 'taal':
-                        # Taal uses special explanation
-                        if isinstance(volcano_config, dict):
-                            explanation = volcano_config.get('explanation')
-                            if explanation:
-                                # For Taal, we need to check if site is on Volcano Island
-                                # This would be in the assessment status, but not always available
-                                # Return None for now - Taal PDZ handling needs assessment status
-                                return None
-                    else:
-                        # Other volcanoes might have radius_km
-                        if isinstance(volcano_config, dict):
-                            radius_km = volcano_config.get('radius_km')
-                    break
-
-            # If no special case found, return None (general PDZ not in schema)
-            if radius_km is None:
-                return None
+        # If no special case found, return None (general PDZ not in schema)
+        radius_km = self._get_pdz_radius(volcano_name)
+        if radius_km is None:
+            _pdz_log.debug("%s: no PDZ radius special case", volcano_name)
+            return None
 
+        try:
             # Get distance to volcano
             volcano_info = self._parse_nearest_volcano(assessment)
             distance_km = volcano_info.get('distance', 0.0)
+        except (AttributeError, TypeError):
+            _pdz_log.debug("%s: no nearest active volcano distance", volcano_name)
+            return None
+
+        inside = distance_km < radius_km
+        _pdz_log.debug(
+            "%s: distance %.1f km, radius %.1f km, inside PDZ: %s",
+            volcano_name, distance_km, radius_km, inside
+        )
+        return self._pdz_section(rule, volcano_name, radius_km, inside)
+
+    def process_pdz_batch(
+        self,
+        items: List[Tuple[Assessment, str]]
+    ) -> List[Optional[HARSection]]:
+        """
+        Process Permanent Danger Zone assessments for many sites.
+
+        The PDZ rule is resolved once, radii and distances are extracted
+        column-wise, and every site is classified inside/outside in one
+        pass before any section text is looked up or built.
+
+        Args:
+            items: (assessment, volcano name) pairs
+
+        Returns:
+            HARSection for PDZ or None (if not applicable) per item, in order
+        """
+        rule = self._rule_pdz
+        if not rule:
+            return [None] * len(items)
+
+        radii = [self._get_pdz_radius(volcano_name) for _, volcano_name in items]
+        distances = _parse_distances([
+            assessment.volcano.nearest_active_volcano if assessment.volcano else None
+            for assessment, _ in items
+        ])
+
+        inside_flags = _classify_pdz(distances, radii)
+
+        return [
+            self._pdz_section(rule, volcano_name, radius_km, inside)
+            if inside is not None else None
+            for (_, volcano_name), radius_km, inside in zip(items, radii, inside_flags)
+        ]
+
+    def _get_pdz_radius(self, volcano_name: str) -> Optional[float]:
+        """
+        Look up the PDZ radius for a volcano.
+
+        Args:
+            volcano_name: Name of volcano (case-insensitive)
+
+        Returns:
+            Radius in km, or None if the volcano has no radius-based PDZ
+            (Taal's PDZ is Volcano Island, which needs assessment status)
+        """
+        config = self._get_volcano_config(volcano_name)
+        return config.pdz_radius_km if config else None
+
+    def _pdz_section(
+        self,
+        rule: HazardRule,
+        volcano_name: str,
+        radius_km: float,
+        inside: bool
+    ) -> Optional[HARSection]:
+        """
+        Get the PDZ section for one site.
+
+        Args:
+            rule: PDZ rule from schema
+            volcano_name: Name of volcano
+            radius_km: PDZ radius of the volcano
+            inside: Whether the site is within the PDZ radius
+
+        Returns:
+            HARSection for PDZ or None if not applicable
+        """
+        # Text depends only on the volcano, radius and side of the boundary,
+        # so the section is shared by every site with the same outcome
+        key = (volcano_name, radius_km, inside)
+        section = self._pdz_sections.get(key)
+        if section is None:
+            section = self._build_pdz_section(rule, volcano_name, radius_km, inside)
+            # Names come from user input, so stop caching once full
+            if section is not None and len(self._pdz_sections) < _PDZ_SECTION_CACHE_SIZE:
+                self._pdz_sections[key] = section
+        return section
+
+    def _build_pdz_section(
+        self,
+        rule: HazardRule,
+        volcano_name: str,
+        radius_km: float,
+        inside: bool
+    ) -> Optional[HARSection]:
+        """
+        Generate PDZ section text for a site inside or outside the PDZ.
+
+        Args:
+            rule: PDZ rule from schema
+            volcano_name: Name of volcano
+            radius_km: PDZ radius of the volcano
+            inside: Whether the site is within the PDZ radius
 
-            # Determine if inside or outside PDZ
-            if distance_km < radius_km:
+        Returns:
+            HARSection for PDZ or None on malformed schema data
+        """
+        try:
+            radius = str(int(radius_km))
+            if inside:
                 # Inside PDZ
-                status = f"Within PDZ; The site is within the {int(radius_km)}-kilometer radius Permanent Danger Zone"
+                status = _PDZ_INSIDE_STATUS.format(radius=radius)
 
                 # Get explanation and recommendation from schema
                 explanation = rule.explanation or ''
@@ -506,22 +1208,19 @@ class DecisionEngine:
 
                 # Replace placeholders
                 explanation = explanation.replace('{volcano_name}', volcano_name)
-                explanation = explanation.replace('{radius}', str(int(radius_km)))
+                explanation = explanation.replace('{radius}', radius)
 
                 exp_rec = ExplanationRecommendation.from_parts(
                     explanation=explanation,
                     recommendation=recommendation
                 )
             else:
-                # Outside PDZ
-                status = f"Outside PDZ; The site is outside the {int(radius_km)}-kilometer radius Permanent Danger Zone"
-
-                # For sites outside PDZ, use simpler explanation
-                explanation = f"The Permanent Danger Zone (PDZ) is a zone that can always be affected by small-scale eruptions of {volcano_name} Volcano. Human settlement is not recommended within the PDZ."
-                recommendation = f"The site is outside the {int(radius_km)}-kilometer radius Permanent Danger Zone of the volcano."
-
+                # Outside PDZ: simpler explanation ending with the site's status
+                status = _PDZ_OUTSIDE_STATUS.format(radius=radius)
                 exp_rec = ExplanationRecommendation.from_parts(
-                    explanation=explanation + " " + recommendation
+                    explanation=_PDZ_OUTSIDE_TEXT.format(
+                        volcano_name=volcano_name, radius=radius
+                    )
                 )
 
             return HARSection(
@@ -548,7 +1247,7 @@ class DecisionEngine:
         try:
             # Extract status from assessment
             status = assessment.volcano.lahar
-            if not status or status == "--":
+            if status in _EMPTY_STATUSES:
                 return None
 
             # Return None if status is "Safe"
@@ -556,65 +1255,29 @@ class DecisionEngine:
                 return None
 
             # Get lahar rule from schema
-            rule = self.schema.volcano_rules.get('lahar')
+            rule = self._rule_lahar
             if not rule:
                 return None
 
-            # Case-insensitive volcano matching
-            volcano_lower = volcano_name.lower()
-
             # Get base explanation and recommendation
             explanation = rule.explanation
             recommendation = rule.recommendation
 
-            # Check for special cases
-            special_cases = rule.special_cases or {}
-
-            # Pinatubo special case - 5 zones
-            if 'pinatubo' in volcano_lower:
-                pinatubo_config = special_cases.get('pinatubo')
-                if pinatubo_config and isinstance(pinatubo_config, dict):
-                    # Add intro for Pinatubo
-                    intro = pinatubo_config.get('intro', '')
-
-                    # Extract zone number from status
-                    zone_match = re.search(r'Zone\s+([1-5])', status, re.IGNORECASE)
-                    if zone_match:
-                        zone_num = zone_match.group(1)
-                        zones = pinatubo_config.get('zones', {})
-                        zone_config = zones.get(f'zone_{zone_num}')
-
-                        if zone_config and isinstance(zone_config, dict):
-                            # Get zone-specific explanation
-                            zone_explanation = zone_config.get('explanation', '')
-                            # Combine intro + zone explanation
-                            if intro and zone_explanation:
-                                explanation = f"{intro} {zone_explanation}"
-
-            # Mayon special case - prone levels
-            elif 'mayon' in volcano_lower:
-                mayon_config = special_cases.get('mayon')
-                if mayon_config and isinstance(mayon_config, dict):
-                    # Add intro for Mayon
-                    intro = mayon_config.get('intro', '')
-
-                    # Map status to prone level
-                    zones = mayon_config.get('zones', {})
-
-                    if 'Highly Prone' in status:
-                        zone_config = zones.get('highly_prone')
-                    elif 'Moderately Prone' in status:
-                        zone_config = zones.get('moderately_prone')
-                    elif 'Least Prone' in status:
-                        zone_config = zones.get('least_prone')
-                    else:
-                        zone_config = None
-
-                    if zone_config and isinstance(zone_config, dict):
-                        # Get zone-specific explanation
-                        zone_explanation = zone_config.get('explanation', '')
-                        if intro and zone_explanation:
-                            explanation = f"{intro} {zone_explanation}"
+            # Special cases from precomputed volcano table
+            config = self._get_volcano_config(volcano_name)
+            if config and config.lahar_zone_explanations:
+                # Pinatubo special case - 5 zones
+                zone_match = _ZONE_RE.search(status)
+                if zone_match:
+                    explanation = config.lahar_zone_explanations.get(
+                        zone_match.group(1), explanation
+                    )
+            elif config and config.lahar_prone_explanations:
+                # Mayon special case - first matching prone level wins
+                for label, zone_explanation in config.lahar_prone_explanations:
+                    if label in status:
+                        explanation = zone_explanation or explanation
+                        break
 
             # General case - use standard explanation/recommendation
             # (already loaded above)
@@ -638,53 +1301,56 @@ class DecisionEngine:
             # Graceful degradation
             return None
 
-    def _process_pyroclastic_flow(self, assessment: Assessment) -> Optional[HARSection]:
+    def _process_simple_hazard(
+        self,
+        assessment: Assessment,
+        spec: HazardSpec
+    ) -> Optional[HARSection]:
         """
-        Process Pyroclastic Flow (PDC) assessments.
+        Process a hazard whose section is its schema rule text.
 
         Args:
             assessment: Assessment with volcano data
+            spec: Which hazard to process
 
         Returns:
-            HARSection for PDC or None if not applicable
+            HARSection for the hazard or None if not applicable
         """
-        try:
-            # Extract status - check multiple possible field names
-            status = assessment.volcano.pyroclastic_flow
-            if not status or status == "--":
-                return None
+        volcano = assessment.volcano
+        if volcano is None:
+            return None
 
-            # Return None if status is "Safe"
-            if "Safe" in status:
-                return None
+        # Extract status from assessment
+        status = getattr(volcano, spec.attr)
+        if status in _EMPTY_STATUSES:
+            return None
 
-            # Get PDC rule from schema
-            rule = self.schema.volcano_rules.get('pyroclastic_density_current')
-            if not rule:
-                return None
+        # Skip if Safe
+        if spec.is_safe(status):
+            return None
 
-            # Get explanation and recommendation
-            explanation = rule.explanation
-            recommendation = rule.recommendation
+        # Prebuilt from the schema rule (None if it has no explanation)
+        exp_rec = self._hazard_exp_recs[spec.rule_attr]
+        if exp_rec is None:
+            return None
 
-            if not explanation:
-                return None
+        return HARSection(
+            heading=spec.heading,
+            assessment=status,
+            explanation_recommendation=exp_rec
+        )
 
-            # Create ExplanationRecommendation
-            exp_rec = ExplanationRecommendation.from_parts(
-                explanation=explanation,
-                recommendation=recommendation
-            )
+    def _process_pyroclastic_flow(self, assessment: Assessment) -> Optional[HARSection]:
+        """
+        Process Pyroclastic Flow (PDC) assessments.
 
-            return HARSection(
-                heading="Pyroclastic Density Current",
-                assessment=status,
-                explanation_recommendation=exp_rec
-            )
+        Args:
+            assessment: Assessment with volcano data
 
-        except (KeyError, AttributeError, TypeError):
-            # Graceful degradation
-            return None
+        Returns:
+            HARSection for PDC or None if not applicable
+        """
+        return self._process_simple_hazard(assessment, _PDC_SPEC)
 
     def _process_lava_flow(self, assessment: Assessment) -> Optional[HARSection]:
         """
@@ -696,43 +1362,7 @@ class DecisionEngine:
         Returns:
             HARSection for lava flow or None if not assessed
         """
-        try:
-            # Extract status from assessment
-            status = assessment.volcano.lava_flow
-            if not status or status == "--":
-                return None
-
-            # Skip if Safe
-            if "safe" in status.lower():
-                return None
-
-            # Get lava flow rule from schema
-            rule = self.schema.volcano_rules.get('lava_flow')
-            if not rule:
-                return None
-
-            # Get explanation and recommendation
-            explanation = rule.explanation
-            recommendation = rule.recommendation
-
-            if not explanation:
-                return None
-
-            # Create ExplanationRecommendation
-            exp_rec = ExplanationRecommendation.from_parts(
-                explanation=explanation,
-                recommendation=recommendation
-            )
-
-            return HARSection(
-                heading="Lava Flow",
-                assessment=status,
-                explanation_recommendation=exp_rec
-            )
-
-        except (KeyError, AttributeError, TypeError):
-            # Graceful degradation
-            return None
+        return self._process_simple_hazard(assessment, _LAVA_FLOW_SPEC)
 
     def _process_ballistic_projectiles(self, assessment: Assessment) -> Optional[HARSection]:
         """
@@ -744,43 +1374,7 @@ class DecisionEngine:
         Returns:
             HARSection for ballistic projectiles or None if not assessed
         """
-        try:
-            # Extract status from assessment
-            status = assessment.volcano.ballistic_projectile
-            if not status or status == "--":
-                return None
-
-            # Skip if Safe
-            if "safe" in status.lower():
-                return None
-
-            # Get ballistic projectiles rule from schema
-            rule = self.schema.volcano_rules.get('ballistic_projectiles')
-            if not rule:
-                return None
-
-            # Get explanation and recommendation
-            explanation = rule.explanation
-            recommendation = rule.recommendation
-
-            if not explanation:
-                return None
-
-            # Create ExplanationRecommendation
-            exp_rec = ExplanationRecommendation.from_parts(
-                explanation=explanation,
-                recommendation=recommendation
-            )
-
-            return HARSection(
-                heading="Ballistic Projectiles",
-                assessment=status,
-                explanation_recommendation=exp_rec
-            )
-
-        except (KeyError, AttributeError, TypeError):
-            # Graceful degradation
-            return None
+        return self._process_simple_hazard(assessment, _BALLISTIC_SPEC)
 
     def _process_base_surge(self, assessment: Assessment) -> Optional[HARSection]:
         """
@@ -792,43 +1386,7 @@ class DecisionEngine:
         Returns:
             HARSection for base surge or None if not assessed
         """
-        try:
-            # Extract status from assessment
-            status = assessment.volcano.base_surge
-            if not status or status == "--":
-                return None
-
-            # Skip if Safe
-            if "safe" in status.lower():
-                return None
-
-            # Get base surge rule from schema
-            rule = self.schema.volcano_rules.get('base_surge')
-            if not rule:
-                return None
-
-            # Get explanation and recommendation
-            explanation = rule.explanation
-            recommendation = rule.recommendation
-
-            if not explanation:
-                return None
-
-            # Create ExplanationRecommendation
-            exp_rec = ExplanationRecommendation.from_parts(
-                explanation=explanation,
-                recommendation=recommendation
-            )
-
-            return HARSection(
-                heading="Base Surge",
-                assessment=status,
-                explanation_recommendation=exp_rec
-            )
-
-        except (KeyError, AttributeError, TypeError):
-            # Graceful degradation
-            return None
+        return self._process_simple_hazard(assessment, _BASE_SURGE_SPEC)
 
     def _process_volcanic_tsunami(self, assessment: Assessment) -> Optional[HARSection]:
         """
@@ -843,43 +1401,7 @@ class DecisionEngine:
         Returns:
             HARSection for volcanic tsunami or None if not assessed
         """
-        try:
-            # Check if field exists in assessment
-            status = assessment.volcano.volcanic_tsunami
-            if not status or status == "--":
-                return None
-
-            # Skip if Safe
-            if "safe" in status.lower():
-                return None
-
-            # Get volcanic tsunami rule from schema
-            rule = self.schema.volcano_rules.get('volcanic_tsunami')
-            if not rule:
-                return None
-
-            # Get explanation and recommendation
-            explanation = rule.explanation
-            recommendation = rule.recommendation
-
-            if not explanation:
-                return None
-
-            # Create ExplanationRecommendation
-            exp_rec = ExplanationRecommendation.from_parts(
-                explanation=explanation,
-                recommendation=recommendation
-            )
-
-            return HARSection(
-                heading="Volcanic Tsunami",
-                assessment=status,
-                explanation_recommendation=exp_rec
-            )
-
-        except (KeyError, AttributeError, TypeError):
-            # Graceful degradation
-            return None
+        return self._process_simple_hazard(assessment, _TSUNAMI_SPEC)
 
     def _process_fissure(self, assessment: Assessment, volcano_name: str, distance_km: float) -> Optional[HARSection]:
         """
@@ -900,67 +1422,10 @@ class DecisionEngine:
         Returns:
             HARSection for fissure or None if not assessed
         """
-        try:
-            # Only assess fissures if site is < 50km or within watershed
-            # (watershed determination would need additional data)
-            if distance_km > 50.0:
-                return None
-
-            # Extract fissure status
-            fissure_status = assessment.volcano.fissure
-
-            if not fissure_status or fissure_status == "--":
-                return None
-
-            # Get fissure rule from schema
-            rule = self.schema.volcano_rules.get('fissure')
-            if not rule:
-                return None
-
-            # Build explanation from schema parts
-            explanation_parts = []
-
-            # Main explanation (applies to all volcanoes)
-            if rule.explanation:
-                explanation_parts.append(rule.explanation)
-
-            # Development info
-            if rule.development:
-                explanation_parts.append(rule.development)
-
-            # Combine explanation
-            explanation = " ".join(explanation_parts) if explanation_parts else ""
-
-            # Get recommendation (applies to all volcanoes)
-            recommendation = rule.recommendation or ""
-
-            # Add Taal-specific reporting if applicable
-            volcano_lower = volcano_name.lower()
-            if "taal" in volcano_lower:
-                special_cases = rule.special_cases or {}
-                taal_config = special_cases.get('taal', {})
-                reporting = taal_config.get('reporting', '')
-                if reporting:
-                    recommendation += f" {reporting}"
-
-            if not explanation:
-                return None
-
-            # Create ExplanationRecommendation
-            exp_rec = ExplanationRecommendation.from_parts(
-                explanation=explanation,
-                recommendation=recommendation
-            )
-
-            return HARSection(
-                heading="Fissure",
-                assessment=fissure_status,
-                explanation_recommendation=exp_rec
-            )
-
-        except (KeyError, AttributeError, TypeError):
-            # Graceful degradation
-            return None
+        # TODO: No Fissure section is emitted yet. The fissure text needs the
+        # rule's development part (not in the HazardRule model), and which
+        # fissure statuses warrant a section still needs domain review.
+        return None
 
     def _check_needs_avoidance(self, assessment: Assessment) -> bool:
         """
@@ -974,107 +1439,72 @@ class DecisionEngine:
         Returns:
             True if avoidance recommendation should be included
         """
-        try:
-            volcano = assessment.volcano
-
-            # Check PDZ - not in current assessment fields, skip for now
-
-            # Check Lahar
-            if volcano.lahar:
-                status = volcano.lahar.lower()
-                if 'prone' in status or 'susceptible' in status:
-                    if 'safe' not in status:  # Exclude "Safe" statuses
-                        return True
-
-            # Check Pyroclastic Flow
-            if volcano.pyroclastic_flow:
-                status = volcano.pyroclastic_flow.lower()
-                if 'prone' in status or 'susceptible' in status or 'within' in status:
-                    if 'safe' not in status:
-                        return True
-
-            # Check Lava Flow
-            if volcano.lava_flow:
-                status = volcano.lava_flow.lower()
-                if 'prone' in status or 'within' in status:
-                    if 'safe' not in status:
-                        return True
-
-            # Check Ballistic Projectiles
-            if volcano.ballistic_projectile:
-                status = volcano.ballistic_projectile.lower()
-                if 'prone' in status or 'within' in status:
-                    if 'safe' not in status:
-                        return True
-
+        volcano = assessment.volcano
+        if volcano is None:
             return False
 
-        except (AttributeError, TypeError):
-            # Graceful degradation
-            return False
+        # PDZ is not in current assessment fields, so it is not checked
+        for attr, needed in _AVOIDANCE_FLAGS:
+            status = getattr(volcano, attr)
+            if status and status not in _SAFE_LITERALS:
+                flags = _classify_status(status)
+                if flags & needed and not flags & _FLAG_SAFE:
+                    return True
 
-    def _get_avoidance_recommendation(self) -> ExplanationRecommendation:
-        """
-        Get avoidance recommendation for prone volcanic hazards.
+        return False
 
-        Returns:
-            ExplanationRecommendation with avoidance text from schema
+    def _check_needs_avoidance_batch(
+        self,
+        volcanoes: List[Optional[VolcanoAssessment]]
+    ) -> List[bool]:
         """
-        try:
-            # Get from schema - based on schema, avoidance is in individual hazard rules
-            # Use standard avoidance text for PDC and lava flows
-
-            # Get from pyroclastic_density_current rule as it has the avoidance text
-            pdc_rule = self.schema.volcano_rules.get('pyroclastic_density_current')
-            if pdc_rule and pdc_rule.recommendation:
-                return ExplanationRecommendation.from_parts(
-                    recommendation=pdc_rule.recommendation
-                )
+        Batch version of _check_needs_avoidance.
 
-            # Fallback to generic avoidance
-            text = (
-                "Avoidance is recommended for site/sites that may potentially be affected by "
-                "pyroclastic density currents (PDCs) and lava flows."
-            )
-            return ExplanationRecommendation.from_parts(
-                recommendation=text
-            )
+        Materializes each proximity hazard field as a flat column of statuses
+        and classifies the column in one pass, instead of walking every
+        assessment's fields row by row.
 
-        except (KeyError, AttributeError, TypeError):
-            # Fallback
-            text = (
-                "Avoidance is recommended for site/sites that may potentially be affected by "
-                "pyroclastic density currents (PDCs) and lava flows."
-            )
-            return ExplanationRecommendation.from_parts(
-                recommendation=text
-            )
+        Args:
+            volcanoes: Volcano assessment data per row (None rows never need avoidance)
 
-    def _check_distance_based_safety(self, assessment: Assessment, distance_km: float) -> bool:
+        Returns:
+            Avoidance flag for each row, in input order
         """
-        Check if site is safe from proximity hazards based on distance.
-
-        Distance-based safety statement is shown when site is > ~50-60km from volcano.
-        This is independent of hazard statuses - even if some hazards (like lahar)
-        are Prone, the distance-based statement still appears for proximity hazards
-        (PDC, lava flows, ballistic projectiles).
+        needs = [False] * len(volcanoes)
+        for attr, needed in _AVOIDANCE_FLAGS:
+            column = [
+                getattr(volcano, attr) if volcano is not None else None
+                for volcano in volcanoes
+            ]
+            for index, status in enumerate(column):
+                if status and not needs[index] and status not in _SAFE_LITERALS:
+                    flags = _classify_status(status)
+                    if flags & needed and not flags & _FLAG_SAFE:
+                        needs[index] = True
+
+        return needs
 
-        Evidence: HAS-Apr-25-14786 has distance-based safety at 64.4km even though
-        Lahar status is "Prone".
-
-        Args:
-            assessment: Volcano assessment data (unused, kept for compatibility)
-            distance_km: Distance to nearest volcano in km
+    def _get_avoidance_recommendation(self) -> ExplanationRecommendation:
+        """
+        Get avoidance recommendation for prone volcanic hazards.
 
         Returns:
-            True if distance-based safety statement should be included
+            ExplanationRecommendation with avoidance text from schema
         """
-        # Threshold is approximately 50-60km based on official HARs
-        # Using 50km as conservative threshold
-        if distance_km > 50.0:
-            return True
+        return self._avoidance_rec
+
+    @cached_property
+    def _avoidance_rec(self) -> ExplanationRecommendation:
+        """Avoidance recommendation, resolved from the schema once per engine."""
+        # Get from pyroclastic_density_current rule as it has the avoidance text
+        pdc_rule = self._rule_pdc
+        if pdc_rule and pdc_rule.recommendation:
+            return ExplanationRecommendation.from_parts(
+                recommendation=pdc_rule.recommendation
+            )
 
-        return False
+        # Fallback to generic avoidance
+        return _DEFAULT_AVOIDANCE
 
     def _get_distance_safe_section(self, volcano_name: str) -> HARSection:
         """
@@ -1086,24 +1516,10 @@ class DecisionEngine:
         Returns:
             HARSection for distance-based safety
         """
-        rule = self.schema.volcano_rules.get('distance_rules', {})
-
-        # Get the safe statement
-        safe_statement = (
-            "Considering the distance of the site/s from the volcano, "
-            "the site/s is/are safe from volcanic hazards such as "
-            "pyroclastic density currents, lava flows, and ballistic "
-            "projectiles that may originate from the volcano."
-        )
-
-        exp_rec = ExplanationRecommendation.from_parts(
-            explanation=safe_statement
-        )
-
         return HARSection(
             heading="Proximity Hazards",
             assessment=f"Safe (> 50 km from {volcano_name} Volcano)",
-            explanation_recommendation=exp_rec
+            explanation_recommendation=_DISTANCE_SAFE_SECTION_EXP_REC
         )
 
     def _process_pav(self, assessment: Assessment) -> HARSection:
@@ -1120,11 +1536,8 @@ class DecisionEngine:
 
         # Extract volcano name from text if possible
         # Format: "Corregidor Volcano is currently classified as potentially active volcano"
-        volcano_name = "Unknown"
-        if "Volcano" in pav_text:
-            parts = pav_text.split("Volcano")
-            if parts:
-                volcano_name = parts[0].strip()
+        match = _PAV_PREFIX_RE.match(pav_text)
+        volcano_name = match.group('name') if match else "Unknown"
 
         exp_rec = ExplanationRecommendation.from_parts(
             explanation=pav_text
@@ -1146,25 +1559,7 @@ class DecisionEngine:
         Returns:
             ExplanationRecommendation for ashfall
         """
-        # Ashfall is in common rule's special_cases (stored as raw dict)
-        common_rule = self.schema.volcano_rules.get('common')
-        if common_rule and common_rule.special_cases:
-            ashfall_data = common_rule.special_cases.get('ashfall', {})
-            ashfall_template = ashfall_data.get('template', '')
-        else:
-            # Fallback generic ashfall statement
-            ashfall_template = (
-                "In case of future eruptions of {volcano_name} Volcano and other nearby volcanoes, "
-                "the site/s may be affected by tephra fall/ ashfall depending on the height of the eruption plume "
-                "and prevailing wind direction at the time of eruption."
-            )
-
-        # Substitute volcano name
-        explanation = ashfall_template.replace('{volcano_name}', volcano_name)
-
-        return ExplanationRecommendation.from_parts(
-            explanation=explanation
-        )
+        return _build_ashfall_statement(self._ashfall_parts, volcano_name)
 
     def _get_pav_statement(self, pav_text: str) -> ExplanationRecommendation:
         """
@@ -1182,22 +1577,7 @@ class DecisionEngine:
         Returns:
             ExplanationRecommendation for PAV
         """
-        # Extract volcano name from text
-        # Format: "Approximately 15.8 kilometers northeast of Labo Volcano"
-        volcano_name = "Unknown"
-        if "of " in pav_text and "Volcano" in pav_text:
-            parts = pav_text.split("of ")[-1]  # Get part after "of "
-            volcano_name = parts.split(" Volcano")[0].strip()
-
-        # Standard PAV explanation (exact wording from official HARs)
-        explanation = (
-            f"{volcano_name} Volcano is currently classified by DOST-PHIVOLCS as a "
-            f"potentially active volcano, which is morphologically young-looking but with "
-            f"no historical or analytical records of eruption, therefore, its eruptive and "
-            f"hazard potential is yet to be determined."
-        )
-
-        return ExplanationRecommendation.from_parts(explanation=explanation)
+        return _build_pav_statement(pav_text)
 
     def _get_supersedes_statement(self, single_site: bool = True) -> str:
         """
@@ -1209,16 +1589,7 @@ class DecisionEngine:
         Returns:
             Supersedes statement text
         """
-        if single_site:
-            return (
-                "This assessment supersedes all previous reports "
-                "issued for this site."
-            )
-        else:
-            return (
-                "This assessment supersedes all previous reports "
-                "issued for these sites."
-            )
+        return _SUPERSEDES_SINGLE if single_site else _SUPERSEDES_MULTI
 
     def _get_additional_recommendations(self) -> List[str]:
         """
@@ -1227,10 +1598,5 @@ class DecisionEngine:
         Returns:
             List of additional recommendation texts
         """
-        return [
-            (
-                "For more information on geohazards in the Philippines, "
-                "please visit HazardHunterPH (https://hazardhunter.georisk.gov.ph/) "
-                "and GeoAnalyticsPH (https://geoanalytics.georisk.gov.ph/)."
-            )
-        ]
+        # Copy so callers may extend their HAROutput's list safely
+        return list(_ADDITIONAL_RECOMMENDATIONS)
@@ -16,14 +16,19 @@ Usage:
 import subprocess
 import time
 import requests
+from requests.adapters import HTTPAdapter
 import sys
-import signal
 import os
 import re
 import html
+import traceback
 from pathlib import Path
 
 
+# CSRF token embedded in the index page by Flask-WTF (matched on raw bytes)
+_CSRF_RE = re.compile(rb'const\s+csrfToken\s*=\s*"([^"]+)"')
+
+
 class Colors:
     """ANSI color codes for terminal output"""
     HEADER = '\033[95m'
@@ -77,20 +82,35 @@ def start_flask_server():
     process = subprocess.Popen(
         [python_executable, 'run.py'],
         cwd=script_dir,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        preexec_fn=os.setsid  # Create new process group for clean shutdown
+        # Single process (no reloader child), so terminating it stops the server
+        env={**os.environ, 'RELOAD': '0'},
+        # Output is never read; a PIPE would block the server once full
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
     )
 
     return process
 
 
-def wait_for_server(url, timeout=30, interval=0.5):
+def create_session():
+    """
+    Create a keep-alive HTTP session shared by readiness polling and tests.
+
+    Returns:
+        requests.Session: Session with a single pooled connection
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1)
+    session.mount('http://', adapter)
+    return session
+
+
+def wait_for_server(session, url, timeout=30, interval=0.1):
     """
     Wait for server to be ready.
 
     Args:
+        session: HTTP session to poll with (connection is reused once up)
         url: Base URL to check
         timeout: Maximum seconds to wait
         interval: Seconds between checks
@@ -103,7 +123,7 @@ def wait_for_server(url, timeout=30, interval=0.5):
     start_time = time.time()
     while time.time() - start_time < timeout:
         try:
-            response = requests.get(url, timeout=1)
+            response = session.get(url, timeout=0.5)
             if response.status_code in [200, 404]:  # Server is responding
                 print_success(f"Server is ready!")
                 return True
@@ -119,11 +139,12 @@ def wait_for_server(url, timeout=30, interval=0.5):
     return False
 
 
-def test_api_endpoint(base_url):
+def test_api_endpoint(session, base_url):
     """
     Test the /api/generate endpoint with sample data.
 
     Args:
+        session: HTTP session (maintains cookies for CSRF validation)
         base_url: Base URL of the API server
 
     Returns:
@@ -139,9 +160,6 @@ def test_api_endpoint(base_url):
     print_info("Sample input data:")
     print(f"{Colors.BOLD}{sample_table}{Colors.ENDC}\n")
 
-    # Create a session to maintain cookies
-    session = requests.Session()
-
     # Fetch CSRF token from index page
     print_info("Fetching CSRF token...")
     try:
@@ -157,9 +175,9 @@ def test_api_endpoint(base_url):
 
     # Extract CSRF token from HTML (Flask-WTF embeds it in the page)
     csrf_token = None
-    match = re.search(r'const\s+csrfToken\s*=\s*"([^"]+)"', index_response.text)
+    match = _CSRF_RE.search(index_response.content)
     if match:
-        csrf_token = match.group(1)
+        csrf_token = match.group(1).decode()
         # Decode if it's HTML-encoded
         csrf_token = html.unescape(csrf_token)
 
@@ -244,7 +262,6 @@ def test_api_endpoint(base_url):
         return False
     except Exception as e:
         print_error(f"Unexpected error: {str(e)}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -258,26 +275,18 @@ def stop_server(process):
     """
     print_info("Stopping Flask server...")
 
-    try:
-        # Kill the entire process group
-        os.killpg(os.getpgid(process.pid), signal.SIGTERM)
+    process.terminate()
 
-        # Wait for process to terminate
-        try:
-            process.wait(timeout=5)
-            print_success("Server stopped successfully")
-        except subprocess.TimeoutExpired:
-            # Force kill if it doesn't stop
-            print_info("Force killing server...")
-            os.killpg(os.getpgid(process.pid), signal.SIGKILL)
-            process.wait()
-            print_success("Server killed")
-
-    except ProcessLookupError:
-        # Process already terminated
-        print_success("Server already stopped")
-    except Exception as e:
-        print_error(f"Error stopping server: {str(e)}")
+    # Wait for process to terminate
+    try:
+        process.wait(timeout=5)
+        print_success("Server stopped successfully")
+    except subprocess.TimeoutExpired:
+        # Force kill if it doesn't stop
+        print_info("Force killing server...")
+        process.kill()
+        process.wait()
+        print_success("Server killed")
 
 
 def main():
@@ -287,18 +296,19 @@ def main():
     base_url = "http://localhost:5000"
     server_process = None
     test_passed = False
+    session = create_session()
 
     try:
         # 1. Start server
         server_process = start_flask_server()
 
         # 2. Wait for server to be ready
-        if not wait_for_server(base_url, timeout=30):
+        if not wait_for_server(session, base_url, timeout=30):
             print_error("Server failed to start within timeout period")
             sys.exit(1)
 
         # 3. Test API endpoint
-        test_passed = test_api_endpoint(base_url)
+        test_passed = test_api_endpoint(session, base_url)
 
         # 4. Print summary
         print_header("Test Summary")
@@ -315,12 +325,12 @@ def main():
 
     except Exception as e:
         print_error(f"Unexpected error: {str(e)}")
-        import traceback
         traceback.print_exc()
         return 1
 
     finally:
         # 5. Always clean up server process
+        session.close()
         if server_process:
             stop_server(server_process)
 
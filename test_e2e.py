@@ -11,6 +11,11 @@ web application, including:
 - Error handling (no stack traces exposed)
 - Multiple assessment parsing
 
+API behaviour tests run in-process through Flask's test client; the health
+and index tests exercise the real network path against pytest-flask's
+live_server, and only the slow concurrency test starts a run.py server
+subprocess.
+
 Usage:
     pytest test_e2e.py -v
     pytest test_e2e.py -v -k test_earthquake  # Run specific test
@@ -19,27 +24,97 @@ Usage:
 
 import pytest
 import requests
+from requests.adapters import HTTPAdapter
 import subprocess
 import time
 import sys
-import signal
+import socket
 import os
 import re
+import json
 import html
+import concurrent.futures
 from pathlib import Path
 
 
+def _worker_port(base_port=5000):
+    """
+    Compute the server port for this pytest-xdist worker.
+
+    Each worker ("gw0", "gw1", ...) runs its own server on base_port + N so
+    parallel workers don't collide; without xdist the base port is used.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "")
+    return base_port + int(worker[2:]) if worker.startswith("gw") else base_port
+
+
 # Test configuration
-BASE_URL = "http://localhost:5000"
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = _worker_port()
+BASE_URL = f"http://localhost:{SERVER_PORT}"
 SERVER_STARTUP_TIMEOUT = 30
 SERVER_SHUTDOWN_TIMEOUT = 5
+# Per-request timeout; happy-path calls finish in milliseconds, so a hung
+# server fails fast (override with HAR_TEST_TIMEOUT for slow machines)
+API_TIMEOUT = float(os.environ.get("HAR_TEST_TIMEOUT", "2"))
+CONCURRENT_REQUESTS = 16  # Matches the HTTPAdapter pool_maxsize
 
+# Sample OHAS summary tables (tab-separated format from OHAS)
+EARTHQUAKE_SAMPLE = """Assessment	Category	Feature Type	Location	Active Fault	Liquefaction
+24918	Earthquake	Polygon	120.989669,14.537869	Safe; Approximately 7.1 km west of Valley Fault System	High Potential"""
 
-@pytest.fixture(scope="module")
+VOLCANO_SAMPLE = """Assessment	Category	Feature Type	Location	Active Fault	Liquefaction	Landslide	Tsunami	Nearest Active Volcano	Nearest Potentially Active Volcano	Fissure	Lahar	Pyroclastic Flow	Base Surge	Lava Flow	Ballistic Projectile	Volcanic Tsunami
+24778	Volcano	Polygon	125.072479,11.788131	--	--	--	--	Approximately 67.7 kilometers east of Biliran Volcano	Approximately 85.4 km northeast of Cancajanag Volcano	--	Safe	Safe	--	Safe	--	--"""
+
+# Earthquake + volcano assessments in one table
+MULTI_SAMPLE = """Assessment	Category	Feature Type	Location	Active Fault	Liquefaction	Landslide	Tsunami	Nearest Active Volcano	Nearest Potentially Active Volcano	Fissure	Lahar	Pyroclastic Flow	Base Surge	Lava Flow	Ballistic Projectile	Volcanic Tsunami
+24777	Earthquake	Polygon	125.083337,11.772125	Safe; Approximately 458 meters west of the Central Samar Fault: Paranas Segment	Safe	Least to Highly Susceptible; Within the depositional zone	Safe	--	--	--	--	--	--	--	--	--
+24778	Volcano	Polygon	125.072479,11.788131	--	--	--	--	Approximately 67.7 kilometers east of Biliran Volcano	Approximately 85.4 km northeast of Cancajanag Volcano	--	Safe	Safe	--	Safe	--	--"""
+
+# Minimal valid table for CSRF checks (never reaches HAR generation)
+CSRF_SAMPLE = """Assessment	Category	Feature Type	Location	Active Fault
+24918	Earthquake	Polygon	120.989669,14.537869	Safe"""
+
+# Request bodies serialized once, shared by every request that posts them
+EARTHQUAKE_BODY = json.dumps({"summary_table": EARTHQUAKE_SAMPLE}).encode()
+VOLCANO_BODY = json.dumps({"summary_table": VOLCANO_SAMPLE}).encode()
+
+# Summary table one byte over the API's 10 KB MAX_INPUT_SIZE. The size check
+# runs on the parsed JSON field, so the body must really be this large.
+OVERSIZED_INPUT = "A" * (10 * 1024 + 1)
+
+# CSRF token embedded in the index page by Flask-WTF
+CSRF_RE = re.compile(r'const\s+csrfToken\s*=\s*"([^"]+)"')
+
+# Tests using the run.py server subprocess share one worker (and its port)
+# under pytest -n auto --dist loadgroup; all other tests spread across workers
+e2e_server = pytest.mark.xdist_group("e2e_server")
+
+
+@pytest.fixture(scope="session")
+def app():
+    """
+    Application served by pytest-flask's live_server fixture.
+
+    A separate instance from flask_app: live_server sets SERVER_NAME on
+    the app it serves, which would otherwise leak into the test-client
+    tests depending on run order.
+
+    Returns:
+        Flask: Application configured for testing
+    """
+    from app import create_app
+    return create_app(testing=True)
+
+
+@pytest.fixture(scope="session")
 def test_server():
     """
     Start Flask server for testing and ensure clean shutdown.
 
+    Only the slow concurrency test uses this: it stresses a separate
+    run.py process, while other network tests use live_server.
+
     This fixture:
     1. Starts the Flask development server in a subprocess
     2. Waits for server to be ready
@@ -64,35 +139,41 @@ def test_server():
     process = subprocess.Popen(
         [python_executable, 'run.py'],
         cwd=script_dir,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        preexec_fn=os.setsid  # Create new process group for clean shutdown
+        # Single process (no reloader child), so terminating it stops the server
+        env={**os.environ, 'PORT': str(SERVER_PORT), 'RELOAD': '0'},
+        # Output is never read; an undrained PIPE would block the server once full
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
     )
 
     # Wait for server to be ready
     start_time = time.time()
     server_ready = False
 
+    # Probe the listen socket; a refused connect fails fast until it is bound
     while time.time() - start_time < SERVER_STARTUP_TIMEOUT:
         try:
-            response = requests.get(BASE_URL, timeout=1)
-            if response.status_code in [200, 404]:
-                server_ready = True
-                print(f"✓ Server ready at {BASE_URL}")
-                break
-        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
-            pass
+            socket.create_connection((SERVER_HOST, SERVER_PORT), timeout=0.1).close()
+        except OSError:
+            time.sleep(0.025)
+            continue
 
-        time.sleep(0.5)
+        # Listening - confirm the app actually serves requests, retrying
+        # until the deadline if it accepted the socket but is not ready yet
+        try:
+            response = requests.get(BASE_URL, timeout=API_TIMEOUT)
+            server_ready = response.status_code in [200, 404]
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            server_ready = False
+        if server_ready:
+            print(f"✓ Server ready at {BASE_URL}")
+            break
+        time.sleep(0.025)
 
     if not server_ready:
         # Clean up and fail
-        try:
-            os.killpg(os.getpgid(process.pid), signal.SIGTERM)
-            process.wait(timeout=5)
-        except:
-            pass
+        process.kill()
+        process.wait()
         pytest.fail(f"Server failed to start within {SERVER_STARTUP_TIMEOUT}s")
 
     # Yield control to tests
@@ -103,31 +184,55 @@ def test_server():
     print("Stopping Flask test server...")
     print("=" * 60)
 
+    process.terminate()
     try:
-        os.killpg(os.getpgid(process.pid), signal.SIGTERM)
-        try:
-            process.wait(timeout=SERVER_SHUTDOWN_TIMEOUT)
-            print("✓ Server stopped cleanly")
-        except subprocess.TimeoutExpired:
-            os.killpg(os.getpgid(process.pid), signal.SIGKILL)
-            process.wait()
-            print("✓ Server forcefully terminated")
-    except ProcessLookupError:
-        print("✓ Server already stopped")
-    except Exception as e:
-        print(f"⚠ Warning: Error stopping server: {e}")
+        process.wait(timeout=SERVER_SHUTDOWN_TIMEOUT)
+        print("✓ Server stopped cleanly")
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+        print("✓ Server forcefully terminated")
 
 
-@pytest.fixture
+def new_session():
+    """
+    Create a keep-alive requests session with a pooled HTTP adapter.
+
+    The pool blocks when all connections are busy, so concurrent callers
+    wait for a kept-alive connection instead of opening throwaway ones.
+
+    Returns:
+        requests.Session: Session reusing connections to the test server
+    """
+    session = requests.Session()
+    session.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=16, pool_block=True))
+    return session
+
+
+@pytest.fixture(scope="module")
+def http_session():
+    """
+    Plain keep-alive session (no CSRF) for page and health checks.
+
+    Yields:
+        requests.Session: Shared session for the module
+    """
+    session = new_session()
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="module")
 def api_session(test_server):
     """
     Create a requests session with CSRF token for API calls.
 
-    This fixture:
-    1. Creates a new requests session
+    This fixture (shared by all tests in the module):
+    1. Creates a keep-alive requests session
     2. Fetches the index page to get CSRF token
     3. Extracts CSRF token from HTML
-    4. Returns session and token for test to use
+    4. Sets JSON and CSRF headers as session defaults
+    5. Returns session and token for test to use
 
     Args:
         test_server: Base URL from test_server fixture
@@ -135,14 +240,14 @@ def api_session(test_server):
     Yields:
         tuple: (session, csrf_token) for making authenticated API calls
     """
-    session = requests.Session()
+    session = new_session()
 
     # Fetch CSRF token from index page
-    response = session.get(f"{test_server}/", timeout=10)
+    response = session.get(f"{test_server}/", timeout=API_TIMEOUT)
     assert response.status_code == 200, "Failed to fetch index page"
 
     # Extract CSRF token from HTML
-    match = re.search(r'const\s+csrfToken\s*=\s*"([^"]+)"', response.text)
+    match = CSRF_RE.search(response.text)
     assert match, "Could not find CSRF token in HTML"
 
     csrf_token = html.unescape(match.group(1))
@@ -150,20 +255,91 @@ def api_session(test_server):
     # Verify session cookie is set
     assert 'session' in session.cookies, "Session cookie not set"
 
+    session.headers.update({
+        "Content-Type": "application/json",
+        "X-CSRFToken": csrf_token
+    })
+
     yield session, csrf_token
 
     # Cleanup
     session.close()
 
 
+@pytest.fixture(scope="module")
+def thread_pool():
+    """
+    Create a thread pool shared by the concurrency tests in this module.
+
+    Yields:
+        ThreadPoolExecutor: Executor with one worker per concurrent request
+    """
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=CONCURRENT_REQUESTS)
+    yield executor
+    executor.shutdown(wait=True)
+
+
+@pytest.fixture(scope="session")
+def flask_app():
+    """
+    Create the Flask application in-process for functional tests.
+
+    Requests are dispatched through Werkzeug's test client directly to the
+    WSGI app, so these tests need no server subprocess or TCP round-trips.
+    Built once per session: create_app() loads the schema and decision
+    engine, while test clients are cheap to create per test.
+
+    Returns:
+        Flask: Application configured for testing
+    """
+    from app import create_app
+    return create_app(testing=True)
+
+
+@pytest.fixture
+def client(flask_app):
+    """
+    Fresh test client (empty cookie jar) for each test.
+
+    Args:
+        flask_app: Application from flask_app fixture
+
+    Returns:
+        FlaskClient: Test client for the shared application
+    """
+    return flask_app.test_client()
+
+
+@pytest.fixture
+def app_client(client):
+    """
+    Create a test client with CSRF token for API calls.
+
+    Args:
+        client: Test client from client fixture
+
+    Returns:
+        tuple: (client, csrf_token) for making authenticated API calls
+    """
+
+    # Fetch CSRF token from index page (client keeps the session cookie)
+    response = client.get("/")
+    assert response.status_code == 200, "Failed to fetch index page"
+
+    match = CSRF_RE.search(response.get_data(as_text=True))
+    assert match, "Could not find CSRF token in HTML"
+
+    return client, html.unescape(match.group(1))
+
+
 @pytest.mark.e2e
-def test_server_health(test_server):
+def test_server_health(http_session, live_server):
     """
     Test that server health check endpoint responds correctly.
 
     This validates the server is running and the health endpoint works.
     """
-    response = requests.get(f"{test_server}/health", timeout=5)
+    response = http_session.get(live_server.url("/health"), timeout=API_TIMEOUT)
 
     assert response.status_code == 200, "Health check endpoint should return 200"
 
@@ -173,13 +349,13 @@ def test_server_health(test_server):
 
 
 @pytest.mark.e2e
-def test_index_page_loads(test_server):
+def test_index_page_loads(http_session, live_server):
     """
     Test that the main index page loads successfully.
 
     This validates the UI is accessible and contains required elements.
     """
-    response = requests.get(f"{test_server}/", timeout=5)
+    response = http_session.get(live_server.url("/"), timeout=API_TIMEOUT)
 
     assert response.status_code == 200, "Index page should return 200"
     assert 'HAR Automation' in response.text, "Page should contain title"
@@ -190,82 +366,31 @@ def test_index_page_loads(test_server):
 
 @pytest.mark.e2e
 @pytest.mark.integration
-def test_earthquake_har_generation(api_session, test_server):
+@pytest.mark.parametrize("body,expected_id,expected_category", [
+    (EARTHQUAKE_BODY, '24918', 'Earthquake'),
+    (VOLCANO_BODY, '24778', 'Volcano'),
+], ids=["earthquake", "volcano"])
+def test_har_generation(app_client, body, expected_id, expected_category):
     """
-    Test successful generation of earthquake HAR.
+    Test successful generation of earthquake and volcano HARs.
 
     This validates:
-    - API accepts valid earthquake assessment data
+    - API accepts valid assessment data for each category
     - HAR is generated with correct structure
     - Response includes all required fields
     """
-    session, csrf_token = api_session
-
-    # Sample earthquake assessment (tab-separated format from OHAS)
-    earthquake_data = """Assessment	Category	Feature Type	Location	Active Fault	Liquefaction
-24918	Earthquake	Polygon	120.989669,14.537869	Safe; Approximately 7.1 km west of Valley Fault System	High Potential"""
-
-    response = session.post(
-        f"{test_server}/api/generate",
-        json={"summary_table": earthquake_data},
-        headers={
-            "Content-Type": "application/json",
-            "X-CSRFToken": csrf_token
-        },
-        timeout=10
-    )
-
-    assert response.status_code == 200, f"Expected 200, got {response.status_code}"
-
-    data = response.json()
-    assert data.get('success') is True, "Response should indicate success"
-    assert 'hars' in data, "Response should contain 'hars' field"
-
-    hars = data['hars']
-    assert len(hars) == 1, "Should generate exactly 1 HAR"
-
-    har = hars[0]
-    assert har['assessment_id'] == '24918', "Assessment ID should match input"
-    assert har['category'] == 'Earthquake', "Category should be Earthquake"
-    assert 'har_text' in har, "HAR should contain generated text"
-    assert len(har['har_text']) > 0, "HAR text should not be empty"
-
-    # Verify HAR contains expected sections
-    har_text = har['har_text']
-    assert 'EXPLANATION' in har_text, "HAR should contain EXPLANATION section"
-    assert 'RECOMMENDATION' in har_text, "HAR should contain RECOMMENDATION section"
-
-
-@pytest.mark.e2e
-@pytest.mark.integration
-def test_volcano_har_generation(api_session, test_server):
-    """
-    Test successful generation of volcano HAR.
-
-    This validates:
-    - API accepts valid volcano assessment data
-    - Volcano HAR is generated correctly
-    - All volcano-specific fields are processed
-    """
-    session, csrf_token = api_session
+    client, csrf_token = app_client
 
-    # Sample volcano assessment (tab-separated format from OHAS)
-    volcano_data = """Assessment	Category	Feature Type	Location	Active Fault	Liquefaction	Landslide	Tsunami	Nearest Active Volcano	Nearest Potentially Active Volcano	Fissure	Lahar	Pyroclastic Flow	Base Surge	Lava Flow	Ballistic Projectile	Volcanic Tsunami
-24778	Volcano	Polygon	125.072479,11.788131	--	--	--	--	Approximately 67.7 kilometers east of Biliran Volcano	Approximately 85.4 km northeast of Cancajanag Volcano	--	Safe	Safe	--	Safe	--	--"""
-
-    response = session.post(
-        f"{test_server}/api/generate",
-        json={"summary_table": volcano_data},
-        headers={
-            "Content-Type": "application/json",
-            "X-CSRFToken": csrf_token
-        },
-        timeout=10
+    response = client.post(
+        "/api/generate",
+        data=body,
+        content_type="application/json",
+        headers={"X-CSRFToken": csrf_token}
     )
 
     assert response.status_code == 200, f"Expected 200, got {response.status_code}"
 
-    data = response.json()
+    data = response.get_json()
     assert data.get('success') is True, "Response should indicate success"
     assert 'hars' in data, "Response should contain 'hars' field"
 
@@ -273,8 +398,8 @@ def test_volcano_har_generation(api_session, test_server):
     assert len(hars) == 1, "Should generate exactly 1 HAR"
 
     har = hars[0]
-    assert har['assessment_id'] == '24778', "Assessment ID should match input"
-    assert har['category'] == 'Volcano', "Category should be Volcano"
+    assert har['assessment_id'] == expected_id, "Assessment ID should match input"
+    assert har['category'] == expected_category, f"Category should be {expected_category}"
     assert 'har_text' in har, "HAR should contain generated text"
     assert len(har['har_text']) > 0, "HAR text should not be empty"
 
@@ -286,7 +411,7 @@ def test_volcano_har_generation(api_session, test_server):
 
 @pytest.mark.e2e
 @pytest.mark.integration
-def test_multiple_assessments(api_session, test_server):
+def test_multiple_assessments(app_client):
     """
     Test parsing and generation of multiple assessments in one request.
 
@@ -295,26 +420,17 @@ def test_multiple_assessments(api_session, test_server):
     - Each assessment generates a separate HAR
     - All HARs are returned in correct order
     """
-    session, csrf_token = api_session
-
-    # Multiple assessments (earthquake + volcano)
-    multi_data = """Assessment	Category	Feature Type	Location	Active Fault	Liquefaction	Landslide	Tsunami	Nearest Active Volcano	Nearest Potentially Active Volcano	Fissure	Lahar	Pyroclastic Flow	Base Surge	Lava Flow	Ballistic Projectile	Volcanic Tsunami
-24777	Earthquake	Polygon	125.083337,11.772125	Safe; Approximately 458 meters west of the Central Samar Fault: Paranas Segment	Safe	Least to Highly Susceptible; Within the depositional zone	Safe	--	--	--	--	--	--	--	--	--
-24778	Volcano	Polygon	125.072479,11.788131	--	--	--	--	Approximately 67.7 kilometers east of Biliran Volcano	Approximately 85.4 km northeast of Cancajanag Volcano	--	Safe	Safe	--	Safe	--	--"""
+    client, csrf_token = app_client
 
-    response = session.post(
-        f"{test_server}/api/generate",
-        json={"summary_table": multi_data},
-        headers={
-            "Content-Type": "application/json",
-            "X-CSRFToken": csrf_token
-        },
-        timeout=10
+    response = client.post(
+        "/api/generate",
+        json={"summary_table": MULTI_SAMPLE},
+        headers={"X-CSRFToken": csrf_token}
     )
 
     assert response.status_code == 200, f"Expected 200, got {response.status_code}"
 
-    data = response.json()
+    data = response.get_json()
     assert data.get('success') is True, "Response should indicate success"
     assert 'hars' in data, "Response should contain 'hars' field"
 
@@ -335,7 +451,7 @@ def test_multiple_assessments(api_session, test_server):
 
 
 @pytest.mark.validation
-def test_empty_input_validation(api_session, test_server):
+def test_empty_input_validation(app_client):
     """
     Test that empty input is properly rejected.
 
@@ -344,53 +460,45 @@ def test_empty_input_validation(api_session, test_server):
     - Appropriate error message is returned
     - HTTP 400 status code is used
     """
-    session, csrf_token = api_session
+    client, csrf_token = app_client
 
-    response = session.post(
-        f"{test_server}/api/generate",
+    response = client.post(
+        "/api/generate",
         json={"summary_table": ""},
-        headers={
-            "Content-Type": "application/json",
-            "X-CSRFToken": csrf_token
-        },
-        timeout=10
+        headers={"X-CSRFToken": csrf_token}
     )
 
     assert response.status_code == 400, "Empty input should return 400"
 
-    data = response.json()
+    data = response.get_json()
     assert 'error' in data, "Response should contain error message"
     assert 'No summary table provided' in data['error'], "Error message should be descriptive"
 
 
 @pytest.mark.validation
-def test_whitespace_only_input_validation(api_session, test_server):
+def test_whitespace_only_input_validation(app_client):
     """
     Test that whitespace-only input is properly rejected.
 
     This validates edge case where input contains only spaces/newlines.
     """
-    session, csrf_token = api_session
+    client, csrf_token = app_client
 
-    response = session.post(
-        f"{test_server}/api/generate",
+    response = client.post(
+        "/api/generate",
         json={"summary_table": "   \n\n  \t  "},
-        headers={
-            "Content-Type": "application/json",
-            "X-CSRFToken": csrf_token
-        },
-        timeout=10
+        headers={"X-CSRFToken": csrf_token}
     )
 
     assert response.status_code == 400, "Whitespace-only input should return 400"
 
-    data = response.json()
+    data = response.get_json()
     assert 'error' in data, "Response should contain error message"
 
 
 @pytest.mark.validation
 @pytest.mark.security
-def test_oversized_input_validation(api_session, test_server):
+def test_oversized_input_validation(app_client):
     """
     Test that input larger than 10KB is rejected (DoS protection).
 
@@ -399,31 +507,24 @@ def test_oversized_input_validation(api_session, test_server):
     - Large payloads are rejected before processing
     - Appropriate error message is returned
     """
-    session, csrf_token = api_session
+    client, csrf_token = app_client
 
-    # Generate input larger than 10KB (10 * 1024 bytes)
-    large_input = "A" * (10 * 1024 + 1)
-
-    response = session.post(
-        f"{test_server}/api/generate",
-        json={"summary_table": large_input},
-        headers={
-            "Content-Type": "application/json",
-            "X-CSRFToken": csrf_token
-        },
-        timeout=10
+    response = client.post(
+        "/api/generate",
+        json={"summary_table": OVERSIZED_INPUT},
+        headers={"X-CSRFToken": csrf_token}
     )
 
     assert response.status_code == 400, "Oversized input should return 400"
 
-    data = response.json()
+    data = response.get_json()
     assert 'error' in data, "Response should contain error message"
     assert 'too large' in data['error'].lower(), "Error should mention size limit"
     assert '10240' in data['error'] or '10 KB' in data['error'], "Error should specify the limit"
 
 
 @pytest.mark.security
-def test_csrf_protection_missing_token(test_server):
+def test_csrf_protection_missing_token(client):
     """
     Test that requests without CSRF token are rejected.
 
@@ -432,17 +533,10 @@ def test_csrf_protection_missing_token(test_server):
     - Requests without token are rejected
     - HTTP 400 status code is returned
     """
-    # Create session without fetching CSRF token
-    session = requests.Session()
-
-    sample_data = """Assessment	Category	Feature Type	Location	Active Fault
-24918	Earthquake	Polygon	120.989669,14.537869	Safe"""
-
-    response = session.post(
-        f"{test_server}/api/generate",
-        json={"summary_table": sample_data},
-        headers={"Content-Type": "application/json"},
-        timeout=10
+    # Fresh client that never fetched a CSRF token
+    response = client.post(
+        "/api/generate",
+        json={"summary_table": CSRF_SAMPLE}
     )
 
     # Flask-WTF returns 400 for CSRF validation failure
@@ -450,7 +544,7 @@ def test_csrf_protection_missing_token(test_server):
 
 
 @pytest.mark.security
-def test_csrf_protection_invalid_token(api_session, test_server):
+def test_csrf_protection_invalid_token(app_client):
     """
     Test that requests with invalid CSRF token are rejected.
 
@@ -458,19 +552,12 @@ def test_csrf_protection_invalid_token(api_session, test_server):
     - CSRF tokens are validated
     - Invalid tokens are rejected
     """
-    session, _ = api_session  # Get session but ignore valid token
-
-    sample_data = """Assessment	Category	Feature Type	Location	Active Fault
-24918	Earthquake	Polygon	120.989669,14.537869	Safe"""
+    client, _ = app_client  # Get client but ignore valid token
 
-    response = session.post(
-        f"{test_server}/api/generate",
-        json={"summary_table": sample_data},
-        headers={
-            "Content-Type": "application/json",
-            "X-CSRFToken": "invalid-token-12345"
-        },
-        timeout=10
+    response = client.post(
+        "/api/generate",
+        json={"summary_table": CSRF_SAMPLE},
+        headers={"X-CSRFToken": "invalid-token-12345"}
     )
 
     # Flask-WTF returns 400 for CSRF validation failure
@@ -478,7 +565,7 @@ def test_csrf_protection_invalid_token(api_session, test_server):
 
 
 @pytest.mark.security
-def test_error_no_traceback(api_session, test_server):
+def test_error_no_traceback(app_client):
     """
     Test that server errors don't expose stack traces to clients.
 
@@ -488,25 +575,21 @@ def test_error_no_traceback(api_session, test_server):
     - No stack traces or sensitive data exposed
     - Error is logged server-side (but not returned to client)
     """
-    session, csrf_token = api_session
+    client, csrf_token = app_client
 
     # Send malformed data that will cause parsing error
     malformed_data = "This is not a valid table format at all!"
 
-    response = session.post(
-        f"{test_server}/api/generate",
+    response = client.post(
+        "/api/generate",
         json={"summary_table": malformed_data},
-        headers={
-            "Content-Type": "application/json",
-            "X-CSRFToken": csrf_token
-        },
-        timeout=10
+        headers={"X-CSRFToken": csrf_token}
     )
 
     # Should return 500 for processing error
     assert response.status_code == 500, "Processing error should return 500"
 
-    data = response.json()
+    data = response.get_json()
     assert 'error' in data, "Response should contain error field"
 
     # Verify generic error message (no technical details)
@@ -527,22 +610,19 @@ def test_error_no_traceback(api_session, test_server):
 
 
 @pytest.mark.validation
-def test_missing_json_body(api_session, test_server):
+def test_missing_json_body(app_client):
     """
     Test that requests without JSON body are handled properly.
 
     This validates error handling for malformed requests.
     """
-    session, csrf_token = api_session
+    client, csrf_token = app_client
 
-    response = session.post(
-        f"{test_server}/api/generate",
+    response = client.post(
+        "/api/generate",
         data="not json",
-        headers={
-            "Content-Type": "application/json",
-            "X-CSRFToken": csrf_token
-        },
-        timeout=10
+        content_type="application/json",
+        headers={"X-CSRFToken": csrf_token}
     )
 
     # Should return 4xx error for bad request
@@ -552,39 +632,29 @@ def test_missing_json_body(api_session, test_server):
 
 @pytest.mark.slow
 @pytest.mark.integration
-def test_concurrent_requests(api_session, test_server):
+@e2e_server
+def test_concurrent_requests(api_session, thread_pool, test_server):
     """
     Test that server can handle multiple concurrent requests.
 
     This validates:
     - Server doesn't crash under concurrent load
-    - CSRF tokens work independently per session
+    - Pooled keep-alive connections are shared safely across threads
     - All requests are processed correctly
     """
-    import concurrent.futures
-
-    session, csrf_token = api_session
-
-    sample_data = """Assessment	Category	Feature Type	Location	Active Fault	Liquefaction
-24918	Earthquake	Polygon	120.989669,14.537869	Safe; Approximately 7.1 km west of Valley Fault System	High Potential"""
+    session, _ = api_session
 
     def make_request():
         """Helper function to make a single API request"""
         response = session.post(
             f"{test_server}/api/generate",
-            json={"summary_table": sample_data},
-            headers={
-                "Content-Type": "application/json",
-                "X-CSRFToken": csrf_token
-            },
-            timeout=10
+            data=EARTHQUAKE_BODY,
+            timeout=API_TIMEOUT
         )
         return response.status_code, response.json()
 
-    # Make 5 concurrent requests
-    with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-        futures = [executor.submit(make_request) for _ in range(5)]
-        results = [f.result() for f in concurrent.futures.as_completed(futures)]
+    futures = [thread_pool.submit(make_request) for _ in range(CONCURRENT_REQUESTS)]
+    results = [f.result() for f in concurrent.futures.as_completed(futures)]
 
     # Verify all requests succeeded
     for status_code, data in results:
@@ -594,26 +664,22 @@ def test_concurrent_requests(api_session, test_server):
 
 
 @pytest.mark.integration
-def test_special_characters_in_input(api_session, test_server):
+def test_special_characters_in_input(app_client):
     """
     Test that input with special characters is handled correctly.
 
     This validates proper encoding and parsing of various characters.
     """
-    session, csrf_token = api_session
+    client, csrf_token = app_client
 
     # Data with special characters (em dash, degree symbol, etc.)
     special_char_data = """Assessment	Category	Feature Type	Location	Active Fault	Liquefaction
 24918	Earthquake	Polygon	120.989669°N,14.537869°E	Safe; Approximately 7.1 km west — Valley Fault System	High Potential"""
 
-    response = session.post(
-        f"{test_server}/api/generate",
+    response = client.post(
+        "/api/generate",
         json={"summary_table": special_char_data},
-        headers={
-            "Content-Type": "application/json",
-            "X-CSRFToken": csrf_token
-        },
-        timeout=10
+        headers={"X-CSRFToken": csrf_token}
     )
 
     # Should either succeed or fail gracefully (no crash)
@@ -621,7 +687,7 @@ def test_special_characters_in_input(api_session, test_server):
         "Special characters should not cause unexpected errors"
 
     if response.status_code == 200:
-        data = response.json()
+        data = response.get_json()
         assert 'hars' in data, "Successful response should contain HARs"
 
 
@@ -1,120 +1,68 @@
 """
 Test OHAS format with multiple assessments (2 rows)
+
+Usage:
+    pytest test_multi_assessment.py -v
+    python test_multi_assessment.py   # also writes har_*.txt next to this file
 """
 
+import os
 import sys
 from pathlib import Path
 
+import pytest
+
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.parser import TableParser, SchemaLoader
-from src.pipeline import DecisionEngine
-
-# Real example from user - 2 assessments
-ohas_text = """Hazard Assessment
-Displaying 1-2 of 2 results.
-Assessment
-Category
-Feature Type
-Location
-Active Fault
-Liquefaction
-Landslide
-Tsunami
-Nearest Active Volcano
-Nearest Potentially Active Volcano
-Fissure
-Lahar
-Pyroclastic Flow
-Base Surge
-Lava Flow
-Ballistic Projectile
-Volcanic Tsunami
-
-24777    Earthquake    Polygon    125.083337,11.772125    Safe; Approximately 458 meters west of the Central Samar Fault: Paranas Segment    Safe    Least to Highly Susceptible; Within the depositional zone    Safe    --    --    --    --    --    --    --    --    --
-24778    Volcano    Polygon    125.072479,11.788131    --    --    --    --    Approximately 67.7 kilometers east of Biliran Volcano    Approximately 85.4 km northeast of Cancajanag Volcano    --    Safe    Safe    --    Safe    --    --
-"""
+from src.parser import TableParser
+
+# Directory to write the generated har_*.txt files into for inspection
+# (set when run as a script; plain pytest runs write nothing)
+OUTPUT_DIR_ENV = "HAR_OUTPUT_DIR"
+
+# Text each row's HAR must contain: its heading and its own site details
+EXPECTED_HAR_TEXT = {
+    24777: ("EARTHQUAKE HAZARD ASSESSMENT", "Central Samar Fault"),
+    24778: ("VOLCANO HAZARD ASSESSMENT", "Biliran Volcano is the nearest identified active volcano"),
+}
+
+
+def test_ohas_multi_parse(ohas_multi_text):
+    """Both OHAS rows parse into assessments with their own hazard data."""
+    assessments = TableParser.parse_from_text(ohas_multi_text)
+
+    assert len(assessments) == 2, "Should parse exactly 2 assessments"
 
-print("Testing OHAS format with 2 assessments...")
-print("=" * 60)
-
-try:
-    # Parse
-    assessments = TableParser.parse_from_text(ohas_text)
-
-    print(f"✓ Successfully parsed {len(assessments)} assessment(s)\n")
-
-    # Display parsed data
-    for i, assessment in enumerate(assessments, 1):
-        print(f"Assessment {i}/{len(assessments)}:")
-        print(f"  ID: {assessment.id}")
-        print(f"  Category: {assessment.category.value}")
-        print(f"  Feature Type: {assessment.feature_type.value}")
-        print(f"  Location: {assessment.location}")
-
-        if assessment.earthquake:
-            print(f"  Earthquake Hazards:")
-            if assessment.earthquake.active_fault:
-                print(f"    Active Fault: {assessment.earthquake.active_fault}")
-            if assessment.earthquake.liquefaction:
-                print(f"    Liquefaction: {assessment.earthquake.liquefaction}")
-            if assessment.earthquake.landslide:
-                print(f"    Landslide: {assessment.earthquake.landslide}")
-            if assessment.earthquake.tsunami:
-                print(f"    Tsunami: {assessment.earthquake.tsunami}")
-
-        if assessment.volcano:
-            print(f"  Volcano Hazards:")
-            if assessment.volcano.nearest_active_volcano:
-                print(f"    Nearest AV: {assessment.volcano.nearest_active_volcano}")
-            if assessment.volcano.nearest_pav:
-                print(f"    Nearest PAV: {assessment.volcano.nearest_pav}")
-            if assessment.volcano.lahar:
-                print(f"    Lahar: {assessment.volcano.lahar}")
-            if assessment.volcano.pyroclastic_flow:
-                print(f"    Pyroclastic Flow: {assessment.volcano.pyroclastic_flow}")
-            if assessment.volcano.lava_flow:
-                print(f"    Lava Flow: {assessment.volcano.lava_flow}")
-
-        print()
-
-    print("=" * 60)
-    print("✓ Parsing test passed!\n")
-
-    # Now generate HARs
-    print("Generating HARs...")
-    print("=" * 60)
-
-    loader = SchemaLoader()
-    schema = loader.load()
-    engine = DecisionEngine(schema)
-
-    for i, assessment in enumerate(assessments, 1):
-        print(f"\n{'=' * 60}")
-        print(f"HAR {i}/{len(assessments)}: Assessment {assessment.id} ({assessment.category.value})")
-        print(f"{'=' * 60}\n")
-
-        try:
-            har = engine.process_assessment(assessment)
-            print(har.to_text())
-
-            # Save to file
+    earthquake, volcano = assessments
+    assert earthquake.id == 24777
+    assert earthquake.category.value == 'Earthquake'
+    assert earthquake.earthquake is not None, "Earthquake row should have earthquake hazards"
+    assert 'Central Samar Fault' in earthquake.earthquake.active_fault
+
+    assert volcano.id == 24778
+    assert volcano.category.value == 'Volcano'
+    assert volcano.volcano is not None, "Volcano row should have volcano hazards"
+    assert 'Biliran Volcano' in volcano.volcano.nearest_active_volcano
+
+
+def test_ohas_multi(decision_engine, ohas_multi_text):
+    """Each parsed assessment generates its own HAR."""
+    assessments = TableParser.parse_from_text(ohas_multi_text)
+    output_dir = os.environ.get(OUTPUT_DIR_ENV)
+
+    for assessment in assessments:
+        har = decision_engine.process_assessment(assessment)
+        har_text = har.to_text()
+
+        assert har.category == assessment.category
+        for expected in EXPECTED_HAR_TEXT[assessment.id]:
+            assert expected in har_text, f"HAR for {assessment.id} should contain {expected!r}"
+
+        if output_dir:
             filename = f"har_{assessment.id}_{assessment.category.value.lower()}.txt"
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(har.to_text())
-            print(f"\n✓ Saved to: {filename}")
-
-        except Exception as e:
-            print(f"✗ Failed to generate HAR: {e}")
-            import traceback
-            traceback.print_exc()
-
-    print(f"\n{'=' * 60}")
-    print(f"✓ Generated {len(assessments)} HAR(s) successfully!")
-    print(f"{'=' * 60}")
-
-except Exception as e:
-    print(f"✗ Test failed: {e}")
-    import traceback
-    traceback.print_exc()
-    sys.exit(1)
+            (Path(output_dir) / filename).write_text(har_text, encoding='utf-8')
+
+
+if __name__ == "__main__":
+    os.environ.setdefault(OUTPUT_DIR_ENV, str(Path(__file__).parent))
+    sys.exit(pytest.main([__file__, "-v"]))
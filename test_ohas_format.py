@@ -2,71 +2,54 @@
 Test OHAS native format parsing
 
 This tests the exact format you get when copying from OHAS browser.
+
+Usage:
+    pytest test_ohas_format.py -v
+    python test_ohas_format.py
 """
 
 import sys
 from pathlib import Path
 
+import pytest
+
 sys.path.insert(0, str(Path(__file__).parent))
 
 from src.parser import TableParser
 
-# Exact format from user's example
-ohas_text = """Hazard Assessment
-Displaying 1-1 of 1 result.
-Assessment
-Category
-Feature Type
-Location
-Active Fault
-Liquefaction
-Landslide
-Tsunami
-Nearest Active Volcano
-Nearest Potentially Active Volcano
-Fissure
-Lahar
-Pyroclastic Flow
-Base Surge
-Lava Flow
-Ballistic Projectile
-Volcanic Tsunami
-
-24916    Earthquake    Polygon    121.073821,14.600733    Safe; Approximately 35 meters west of the Valley Fault System: West Valley Fault    --    --    --    --    --    --    --    --    --    --    --    --
-No Files Attached
-"""
 
-print("Testing OHAS native format parsing...")
-print("=" * 60)
+def test_ohas_single_parse(ohas_single_text):
+    """The single OHAS row parses into one earthquake assessment."""
+    assessments = TableParser.parse_from_text(ohas_single_text)
+
+    assert len(assessments) == 1, "Should parse exactly 1 assessment"
+
+    assessment = assessments[0]
+    assert assessment.id == 24916
+    assert assessment.category.value == 'Earthquake'
+    assert assessment.feature_type.value == 'Polygon'
+    assert (assessment.location.longitude, assessment.location.latitude) == (121.073821, 14.600733)
 
-try:
-    assessments = TableParser.parse_from_text(ohas_text)
+    assert assessment.earthquake is not None, "Earthquake row should have earthquake hazards"
+    assert 'West Valley Fault' in assessment.earthquake.active_fault
+    assert assessment.earthquake.liquefaction == '--'
+    assert assessment.volcano is None, "Earthquake row should have no volcano hazards"
 
-    print(f"✓ Successfully parsed {len(assessments)} assessment(s)\n")
+
+@pytest.mark.parametrize("text_fixture,expected_count", [
+    ("ohas_single_text", 1),
+    ("ohas_multi_text", 2),
+], ids=["single", "multi"])
+def test_ohas_har_generation(request, decision_engine, text_fixture, expected_count):
+    """Every assessment parsed from an OHAS page generates a non-empty HAR."""
+    assessments = TableParser.parse_from_text(request.getfixturevalue(text_fixture))
+
+    assert len(assessments) == expected_count
 
     for assessment in assessments:
-        print(f"Assessment ID: {assessment.id}")
-        print(f"Category: {assessment.category.value}")
-        print(f"Feature Type: {assessment.feature_type.value}")
-        print(f"Location: {assessment.location}")
-
-        if assessment.earthquake:
-            print(f"\nEarthquake Hazards:")
-            print(f"  Active Fault: {assessment.earthquake.active_fault}")
-            print(f"  Liquefaction: {assessment.earthquake.liquefaction}")
-            print(f"  Landslide: {assessment.earthquake.landslide}")
-            print(f"  Tsunami: {assessment.earthquake.tsunami}")
-
-        if assessment.volcano:
-            print(f"\nVolcano Hazards:")
-            print(f"  Nearest AV: {assessment.volcano.nearest_active_volcano}")
-            print(f"  Nearest PAV: {assessment.volcano.nearest_pav}")
-
-    print("\n" + "=" * 60)
-    print("✓ Test passed! OHAS format parsing works correctly.")
-
-except Exception as e:
-    print(f"✗ Test failed: {e}")
-    import traceback
-    traceback.print_exc()
-    sys.exit(1)
+        har = decision_engine.process_assessment(assessment)
+        assert har.to_text(), f"HAR for {assessment.id} should not be empty"
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
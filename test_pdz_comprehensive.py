@@ -1,114 +1,80 @@
 #!/usr/bin/env python3
-"""Comprehensive test of PDZ processing"""
+"""
+Comprehensive test of PDZ processing
+
+Usage:
+    pytest test_pdz_comprehensive.py -v
+    python test_pdz_comprehensive.py
+"""
+
+import dataclasses
+import sys
+
+import pytest
 
-from src.pipeline.decision_engine import DecisionEngine
 from src.models import Assessment, AssessmentCategory, VolcanoAssessment, FeatureType, Coordinate
-from src.parser.schema_loader import SchemaLoader
 
-# Load schema
-loader = SchemaLoader()
-schema = loader.load()
 
-# Create decision engine
-engine = DecisionEngine(schema)
+# Template site: no hazard statuses assessed, only the nearest volcano varies
+_BASE_VOLCANO = VolcanoAssessment(
+    nearest_active_volcano='',
+    nearest_pav=None,
+    fissure='--',
+    lahar='--',
+    pyroclastic_flow='--',
+    base_surge='--',
+    lava_flow='--',
+    ballistic_projectile='--',
+    volcanic_tsunami='--'
+)
 
-# Test 1: Mayon at 5.5km (should be WITHIN 6km PDZ)
-print('=== Test 1: Mayon at 5.5km (inside PDZ) ===')
-assessment1 = Assessment(
-    id=1,
+_BASE_ASSESSMENT = Assessment(
+    id=0,
     category=AssessmentCategory.VOLCANO,
     feature_type=FeatureType.POINT,
     location=Coordinate(120.0, 14.0),
-    volcano=VolcanoAssessment(
-        nearest_active_volcano='Approximately 5.5 km north of Mayon Volcano',
-        nearest_pav=None,
-        fissure='--',
-        lahar='--',
-        pyroclastic_flow='--',
-        base_surge='--',
-        lava_flow='--',
-        ballistic_projectile='--',
-        volcanic_tsunami='--'
-    )
+    volcano=_BASE_VOLCANO
 )
 
-result1 = engine._process_pdz(assessment1, 'Mayon')
-if result1:
-    print(f'✓ Heading: {result1.heading}')
-    print(f'✓ Assessment: {result1.assessment}')
-    print(f'✓ Has explanation: {result1.explanation_recommendation is not None}')
-    if result1.explanation_recommendation:
-        exp = result1.explanation_recommendation.text
-        if exp:
-            print(f'  Text: {exp[:100]}...' if len(exp) > 100 else f'  Text: {exp}')
-else:
-    print('✗ Result: None (BUG - should return PDZ section)')
-
-print()
-
-# Test 2: Mayon at 7km (should be OUTSIDE 6km PDZ)
-print('=== Test 2: Mayon at 7km (outside PDZ) ===')
-assessment2 = Assessment(
-    id=2,
-    category=AssessmentCategory.VOLCANO,
-    feature_type=FeatureType.POINT,
-    location=Coordinate(120.0, 14.0),
-    volcano=VolcanoAssessment(
-        nearest_active_volcano='Approximately 7.0 km south of Mayon Volcano',
-        nearest_pav=None,
-        fissure='--',
-        lahar='--',
-        pyroclastic_flow='--',
-        base_surge='--',
-        lava_flow='--',
-        ballistic_projectile='--',
-        volcanic_tsunami='--'
+
+def make_assessment(assessment_id: int, nearest_active_volcano: str) -> Assessment:
+    """Copy the template site with a new ID and nearest active volcano."""
+    return dataclasses.replace(
+        _BASE_ASSESSMENT,
+        id=assessment_id,
+        volcano=dataclasses.replace(
+            _BASE_VOLCANO, nearest_active_volcano=nearest_active_volcano
+        )
     )
-)
 
-result2 = engine._process_pdz(assessment2, 'Mayon')
-if result2:
-    print(f'✓ Heading: {result2.heading}')
-    print(f'✓ Assessment: {result2.assessment}')
-    print(f'✓ Has explanation: {result2.explanation_recommendation is not None}')
-    if result2.explanation_recommendation:
-        exp = result2.explanation_recommendation.text
-        if exp:
-            print(f'  Text: {exp[:100]}...' if len(exp) > 100 else f'  Text: {exp}')
-else:
-    print('✗ Result: None (BUG - should return PDZ section)')
-
-print()
-
-# Test 3: Kanlaon at 3km (within 4km PDZ)
-print('=== Test 3: Kanlaon at 3km (inside 4km PDZ) ===')
-assessment3 = Assessment(
-    id=3,
-    category=AssessmentCategory.VOLCANO,
-    feature_type=FeatureType.POINT,
-    location=Coordinate(120.0, 14.0),
-    volcano=VolcanoAssessment(
-        nearest_active_volcano='Approximately 3.0 km west of Kanlaon Volcano',
-        nearest_pav=None,
-        fissure='--',
-        lahar='--',
-        pyroclastic_flow='--',
-        base_surge='--',
-        lava_flow='--',
-        ballistic_projectile='--',
-        volcanic_tsunami='--'
+
+# (assessment, volcano name, expected PDZ status label, radius text)
+SCENARIOS = [
+    # Mayon at 5.5km (should be WITHIN 6km PDZ)
+    (make_assessment(1, 'Approximately 5.5 km north of Mayon Volcano'), 'Mayon',
+     'Within PDZ', '6-kilometer radius'),
+    # Mayon at 7km (should be OUTSIDE 6km PDZ)
+    (make_assessment(2, 'Approximately 7.0 km south of Mayon Volcano'), 'Mayon',
+     'Outside PDZ', '6-kilometer radius'),
+    # Kanlaon at 3km (within 4km PDZ)
+    (make_assessment(3, 'Approximately 3.0 km west of Kanlaon Volcano'), 'Kanlaon',
+     'Within PDZ', '4-kilometer radius'),
+]
+
+
+def test_pdz_scenarios(decision_engine):
+    """PDZ sections for inside and outside sites, processed as one batch."""
+    results = decision_engine.process_pdz_batch(
+        [(assessment, volcano) for assessment, volcano, _, _ in SCENARIOS]
     )
-)
 
-result3 = engine._process_pdz(assessment3, 'Kanlaon')
-if result3:
-    print(f'✓ Heading: {result3.heading}')
-    print(f'✓ Assessment: {result3.assessment}')
-    print(f'✓ Has explanation: {result3.explanation_recommendation is not None}')
-else:
-    print('✗ Result: None')
-
-print()
-print('=== Summary ===')
-print('All tests passed! The PDZ method is working correctly.')
-print('It generates both inside and outside PDZ statements with proper explanations.')
+    for (assessment, _, expect_label, radius_str), result in zip(SCENARIOS, results):
+        assert result is not None, f"Assessment {assessment.id} should return a PDZ section"
+        assert result.heading == 'PDZ (Permanent Danger Zone)'
+        assert expect_label in result.assessment
+        assert radius_str in result.assessment
+        assert result.explanation_recommendation.text, "PDZ section should have explanation text"
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
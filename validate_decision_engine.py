@@ -8,13 +8,30 @@ Usage:
     python validate_decision_engine.py
     python validate_decision_engine.py --verbose
     python validate_decision_engine.py --test-id 24918
+    python validate_decision_engine.py --jobs 4
+    python validate_decision_engine.py --cache .har_cache
 """
 
+import hashlib
+import io
+import os
+import shelve
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext, redirect_stderr, redirect_stdout
+from itertools import repeat
 from pathlib import Path
-from typing import List, Dict, Tuple
-from difflib import unified_diff, SequenceMatcher
+from typing import List, Dict, Optional, Tuple
+from difflib import SequenceMatcher
+from functools import lru_cache
 import argparse
+import dataclasses
+import json
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON report writing
+    orjson = None
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -22,6 +39,24 @@ sys.path.insert(0, str(Path(__file__).parent))
 from src.parser import OHASParser, SchemaLoader
 from src.pipeline import DecisionEngine
 
+
+def _dumps_report(payload: Dict) -> bytes:
+    """
+    Serialize the JSON report as indented UTF-8 bytes.
+
+    Uses orjson when it is installed, falling back to the standard library.
+
+    Args:
+        payload: Report dictionary
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2, ensure_ascii=False).encode('utf-8')
+
+
 # ANSI color codes for terminal output
 class Colors:
     """ANSI color codes for colored terminal output"""
@@ -47,6 +82,7 @@ class Colors:
         Colors.ENDC = ''
         Colors.BOLD = ''
         Colors.UNDERLINE = ''
+        _rebuild_templates()
 
 
 # Real HAR test cases extracted from actual PHIVOLCS HARs
@@ -143,36 +179,81 @@ TEST_CASES = [
 ]
 
 
-def print_header(text: str, color: str = Colors.HEADER) -> None:
-    """Print a formatted header"""
-    print(f"\n{color}{Colors.BOLD}{'='*70}{Colors.ENDC}")
-    print(f"{color}{Colors.BOLD}{text:^70}{Colors.ENDC}")
-    print(f"{color}{Colors.BOLD}{'='*70}{Colors.ENDC}\n")
+# Preformatted output templates; rebuilt when colors are disabled
+_HEADER_TEMPLATES: Dict[str, str] = {}  # by header color, filled on first use
+_SECTION_TEMPLATE = ''
+_FOUND_PREFIX = ''
+_MISSING_PREFIX = ''
+
+
+def _rebuild_templates() -> None:
+    """Regenerate the cached output templates from the current Colors."""
+    global _SECTION_TEMPLATE, _FOUND_PREFIX, _MISSING_PREFIX
+
+    _HEADER_TEMPLATES.clear()
+    _SECTION_TEMPLATE = f"{Colors.OKCYAN}{Colors.BOLD}{{title}}{Colors.ENDC}\n{{content}}\n"
+    _FOUND_PREFIX = f"  {Colors.OKGREEN}✓{Colors.ENDC} Found: "
+    _MISSING_PREFIX = f"  {Colors.FAIL}✗{Colors.ENDC} Missing: "
+
+
+_rebuild_templates()
+
+
+def print_header(text: str, color: Optional[str] = None) -> None:
+    """Print a formatted header (color defaults to Colors.HEADER)"""
+    if color is None:
+        color = Colors.HEADER
+
+    template = _HEADER_TEMPLATES.get(color)
+    if template is None:
+        rule = f"{color}{Colors.BOLD}{'='*70}{Colors.ENDC}"
+        template = f"\n{rule}\n{color}{Colors.BOLD}{{text:^70}}{Colors.ENDC}\n{rule}\n\n"
+        _HEADER_TEMPLATES[color] = template
+
+    sys.stdout.write(template.format(text=text))
 
 
 def print_section(title: str, content: str = None) -> None:
     """Print a formatted section"""
-    print(f"{Colors.OKCYAN}{Colors.BOLD}{title}{Colors.ENDC}")
-    if content:
-        print(content)
-    print()
+    sys.stdout.write(_SECTION_TEMPLATE.format(
+        title=title,
+        content=f"{content}\n" if content else ''
+    ))
 
 
-def calculate_similarity(text1: str, text2: str) -> float:
+def _lower_bytes(text: str) -> bytes:
     """
-    Calculate similarity ratio between two texts.
+    Lowercase text for phrase matching, as UTF-8 bytes.
+
+    HAR text is essentially ASCII, and bytes.lower() (ASCII-only, a plain
+    table lookup) is much cheaper than Unicode str.lower(); substring
+    search on the bytes is exact. Non-ASCII letters keep their case.
 
     Args:
-        text1: First text
-        text2: Second text
+        text: Text to lowercase
 
     Returns:
-        Similarity ratio (0.0 to 1.0)
+        Lowercased UTF-8 bytes
     """
-    return SequenceMatcher(None, text1.lower(), text2.lower()).ratio()
+    return text.encode('utf-8').lower()
 
 
-def compare_text_content(generated: str, expected_phrases: List[str], test_name: str, verbose: bool = False) -> Tuple[bool, List[str]]:
+@lru_cache(maxsize=64)
+def _lowered_phrases(phrases: Tuple[str, ...]) -> Tuple[bytes, ...]:
+    """
+    Lowercase a test case's expected phrases (cached per phrase list).
+
+    Args:
+        phrases: Expected phrases
+
+    Returns:
+        Lowercased phrases as UTF-8 bytes, in the same order
+    """
+    return tuple(_lower_bytes(phrase) for phrase in phrases)
+
+
+def compare_text_content(generated: str, expected_phrases: List[str], test_name: str, verbose: bool = False,
+                         generated_lower: Optional[bytes] = None) -> Tuple[bool, List[str]]:
     """
     Compare generated text with expected content.
 
@@ -181,24 +262,32 @@ def compare_text_content(generated: str, expected_phrases: List[str], test_name:
         expected_phrases: List of phrases that should be present
         test_name: Name of test case
         verbose: Whether to print verbose output
+        generated_lower: _lower_bytes(generated), if the caller already has it
 
     Returns:
         Tuple of (success, missing_phrases)
     """
-    missing = []
+    if generated_lower is None:
+        generated_lower = _lower_bytes(generated)
+
+    phrases_lower = _lowered_phrases(tuple(expected_phrases))
 
-    for phrase in expected_phrases:
-        if phrase.lower() not in generated.lower():
-            missing.append(phrase)
+    # Common case: everything present and nothing to report
+    if not verbose and all(pl in generated_lower for pl in phrases_lower):
+        return True, []
+
+    # One scan per phrase, shared by the missing list and the report below
+    found = [phrase_lower in generated_lower for phrase_lower in phrases_lower]
+    missing = [phrase for phrase, hit in zip(expected_phrases, found) if not hit]
 
     if verbose or missing:
         print_section(f"Content Validation: {test_name}")
 
-        for phrase in expected_phrases:
-            if phrase.lower() in generated.lower():
-                print(f"  {Colors.OKGREEN}✓{Colors.ENDC} Found: {phrase[:60]}...")
+        for phrase, hit in zip(expected_phrases, found):
+            if hit:
+                print(f"{_FOUND_PREFIX}{phrase[:60]}...")
             else:
-                print(f"  {Colors.FAIL}✗{Colors.ENDC} Missing: {phrase[:60]}...")
+                print(f"{_MISSING_PREFIX}{phrase[:60]}...")
 
     return len(missing) == 0, missing
 
@@ -217,6 +306,8 @@ def validate_structure(har_output, expected_structure: Dict, test_name: str, ver
         Tuple of (success, issues)
     """
     issues = []
+    n_sections = len(har_output.sections)
+    n_common = len(har_output.common_statements)
 
     # Check intro
     if expected_structure.get('intro', False):
@@ -226,16 +317,14 @@ def validate_structure(har_output, expected_structure: Dict, test_name: str, ver
     # Check number of sections
     if 'sections' in expected_structure:
         expected_count = expected_structure['sections']
-        actual_count = len(har_output.sections)
-        if actual_count != expected_count:
-            issues.append(f"Expected {expected_count} sections, got {actual_count}")
+        if n_sections != expected_count:
+            issues.append(f"Expected {expected_count} sections, got {n_sections}")
 
     # Check common statements
     if 'common_statements' in expected_structure:
         expected_count = expected_structure['common_statements']
-        actual_count = len(har_output.common_statements)
-        if actual_count != expected_count:
-            issues.append(f"Expected {expected_count} common statements, got {actual_count}")
+        if n_common != expected_count:
+            issues.append(f"Expected {expected_count} common statements, got {n_common}")
 
     # Check supersedes
     if expected_structure.get('supersedes', False):
@@ -246,8 +335,8 @@ def validate_structure(har_output, expected_structure: Dict, test_name: str, ver
         print_section(f"Structure Validation: {test_name}")
 
         print(f"  Intro: {Colors.OKGREEN if har_output.intro else Colors.FAIL}{'Present' if har_output.intro else 'Missing'}{Colors.ENDC}")
-        print(f"  Sections: {len(har_output.sections)}")
-        print(f"  Common statements: {len(har_output.common_statements)}")
+        print(f"  Sections: {n_sections}")
+        print(f"  Common statements: {n_common}")
         print(f"  Supersedes: {Colors.OKGREEN if har_output.supersedes else Colors.FAIL}{'Present' if har_output.supersedes else 'Missing'}{Colors.ENDC}")
 
         if issues:
@@ -258,26 +347,144 @@ def validate_structure(har_output, expected_structure: Dict, test_name: str, ver
     return len(issues) == 0, issues
 
 
-def highlight_differences(generated: str, expected_phrases: List[str]) -> None:
+def _closest_line(lines: List[str], phrase: str) -> int:
+    """
+    Find the line sharing the longest common run of text with a phrase.
+
+    Args:
+        lines: Generated HAR lines (non-empty list)
+        phrase: Expected phrase
+
+    Returns:
+        Index of the closest line
+    """
+    phrase_lower = phrase.lower()
+    matcher = SequenceMatcher(None, autojunk=False)
+    matcher.set_seq2(phrase_lower)  # seq2 is the side SequenceMatcher indexes
+
+    best_index, best_size = 0, -1
+    for i, line in enumerate(lines):
+        matcher.set_seq1(line.lower())
+        size = matcher.find_longest_match(0, len(line), 0, len(phrase_lower)).size
+        if size > best_size:
+            best_index, best_size = i, size
+    return best_index
+
+
+def highlight_differences(generated: str, expected_phrases: List[str],
+                          generated_lower: Optional[bytes] = None,
+                          context: int = 3) -> None:
     """
     Show detailed differences between generated and expected text.
 
+    Each missing phrase is shown as a small diff hunk against the generated
+    line closest to it, with up to ``context`` lines on either side.
+
     Args:
         generated: Generated HAR text
         expected_phrases: Expected phrases
+        generated_lower: _lower_bytes(generated), if the caller already has it
+        context: Number of context lines around each hunk
     """
+    if generated_lower is None:
+        generated_lower = _lower_bytes(generated)
+
     print_section("Detailed Differences")
 
-    print(f"{Colors.BOLD}Generated HAR (first 500 chars):{Colors.ENDC}")
-    print(generated[:500] + "...\n")
+    missing = [
+        phrase
+        for phrase, phrase_lower in zip(expected_phrases, _lowered_phrases(tuple(expected_phrases)))
+        if phrase_lower not in generated_lower
+    ]
+    if not missing:
+        print(f"{Colors.OKGREEN}✓ No missing expected phrases{Colors.ENDC}\n")
+        return
+
+    lines = generated.splitlines()
+    for phrase in missing:
+        if not lines:
+            print(f"{Colors.BOLD}@@ generated HAR is empty @@{Colors.ENDC}")
+            print(f"{Colors.OKGREEN}+ {phrase}{Colors.ENDC}\n")
+            continue
+
+        i = _closest_line(lines, phrase)
+        print(f"{Colors.BOLD}@@ line {i + 1}: closest to missing phrase @@{Colors.ENDC}")
+        for line in lines[max(0, i - context):i]:
+            print(f"  {line}")
+        print(f"{Colors.FAIL}- {lines[i]}{Colors.ENDC}")
+        print(f"{Colors.OKGREEN}+ {phrase}{Colors.ENDC}")
+        for line in lines[i + 1:i + 1 + context]:
+            print(f"  {line}")
+        print()
+
+
+@lru_cache(maxsize=64)
+def _cached_parse(table: str) -> Tuple:
+    """
+    Parse a test case's input table (cached per input string).
+
+    The returned assessments are shared between calls and must be treated
+    as read-only; copy with dataclasses.replace() before changing a field.
+
+    Args:
+        table: OHAS summary table text
+
+    Returns:
+        Tuple of parsed Assessment objects
+    """
+    return tuple(OHASParser.parse_from_table(table))
+
+
+@lru_cache(maxsize=1)
+def _source_hash() -> str:
+    """
+    Digest of the pipeline source code (src/**/*.py).
+
+    Part of the HAR cache key, so editing the engine or models invalidates
+    cached outputs just like editing the schema does.
+
+    Returns:
+        Hex BLAKE2b digest
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    src_dir = Path(__file__).parent / 'src'
+    for path in sorted(src_dir.rglob('*.py')):
+        digest.update(path.relative_to(src_dir).as_posix().encode('utf-8'))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def generate_har(engine: DecisionEngine, assessment, cache=None):
+    """
+    Generate a HAR, reusing a cached output for an unchanged input.
+
+    Outputs are keyed by (schema file hash, source hash, assessment
+    fingerprint), so a hit is only possible when nothing that could change
+    the output has changed. Schemas built in memory (no source_hash) are
+    never cached.
+
+    Args:
+        engine: DecisionEngine instance
+        assessment: Parsed Assessment
+        cache: Optional shelve of previously generated outputs
+
+    Returns:
+        HAROutput object
+    """
+    schema_hash = engine.schema.source_hash
+    if cache is None or not schema_hash:
+        return engine.process_assessment(assessment)
 
-    print(f"{Colors.BOLD}Missing Expected Phrases:{Colors.ENDC}")
-    for phrase in expected_phrases:
-        if phrase.lower() not in generated.lower():
-            print(f"  {Colors.FAIL}✗{Colors.ENDC} {phrase}")
+    key = f"{schema_hash}:{_source_hash()}:{assessment.fingerprint()}"
+    har_output = cache.get(key)
+    if har_output is None:
+        har_output = engine.process_assessment(assessment)
+        cache[key] = har_output
+    return har_output
 
 
-def run_single_test(test_case: Dict, engine: DecisionEngine, verbose: bool = False) -> Dict:
+def run_single_test(test_case: Dict, engine: DecisionEngine, verbose: bool = False,
+                    cache=None) -> Dict:
     """
     Run a single test case.
 
@@ -285,6 +492,7 @@ def run_single_test(test_case: Dict, engine: DecisionEngine, verbose: bool = Fal
         test_case: Test case dictionary
         engine: DecisionEngine instance
         verbose: Whether to print verbose output
+        cache: Optional shelve of previously generated HAR outputs
 
     Returns:
         Result dictionary
@@ -305,7 +513,7 @@ def run_single_test(test_case: Dict, engine: DecisionEngine, verbose: bool = Fal
     try:
         # 1. Parse input
         print_section("Step 1: Parsing Input")
-        assessments = OHASParser.parse_from_table(test_case['input'])
+        assessments = _cached_parse(test_case['input'])
 
         if not assessments:
             result['passed'] = False
@@ -315,9 +523,12 @@ def run_single_test(test_case: Dict, engine: DecisionEngine, verbose: bool = Fal
 
         assessment = assessments[0]
 
-        # Set vicinity_map_provided if specified in test case
+        # Set vicinity_map_provided if specified in test case (on a copy,
+        # so the cached parse stays pristine)
         if 'vicinity_map_provided' in test_case:
-            assessment.vicinity_map_provided = test_case['vicinity_map_provided']
+            assessment = dataclasses.replace(
+                assessment, vicinity_map_provided=test_case['vicinity_map_provided']
+            )
 
         print(f"{Colors.OKGREEN}✓ Parsed assessment {assessment.id}{Colors.ENDC}")
         print(f"  Category: {assessment.category.value}")
@@ -327,7 +538,7 @@ def run_single_test(test_case: Dict, engine: DecisionEngine, verbose: bool = Fal
 
         # 2. Generate HAR
         print_section("Step 2: Generating HAR")
-        har_output = engine.process_assessment(assessment)
+        har_output = generate_har(engine, assessment, cache)
         print(f"{Colors.OKGREEN}✓ HAR generated successfully{Colors.ENDC}")
 
         # 3. Validate structure
@@ -348,12 +559,14 @@ def run_single_test(test_case: Dict, engine: DecisionEngine, verbose: bool = Fal
         # 4. Validate content
         print_section("Step 4: Validating Content")
         generated_text = har_output.to_text()
+        generated_lower = _lower_bytes(generated_text)
 
         content_valid, missing_phrases = compare_text_content(
             generated_text,
             test_case.get('expected_contains', []),
             test_name,
-            verbose=verbose
+            verbose=verbose,
+            generated_lower=generated_lower
         )
 
         if not content_valid:
@@ -365,7 +578,11 @@ def run_single_test(test_case: Dict, engine: DecisionEngine, verbose: bool = Fal
 
         # 5. Show differences if failed or verbose
         if not result['passed'] or verbose:
-            highlight_differences(generated_text, missing_phrases if not content_valid else [])
+            highlight_differences(
+                generated_text,
+                missing_phrases if not content_valid else [],
+                generated_lower=generated_lower
+            )
 
         # 6. Show full generated HAR in verbose mode
         if verbose:
@@ -399,7 +616,71 @@ def run_single_test(test_case: Dict, engine: DecisionEngine, verbose: bool = Fal
     return result
 
 
-def run_validation(test_ids: List[str] = None, verbose: bool = False, output_file: str = None) -> int:
+# Decision engine of a validation worker process (set by _init_worker)
+_worker_engine: Optional[DecisionEngine] = None
+
+
+def _init_worker(colors_enabled: bool) -> None:
+    """
+    Initialize a validation worker process.
+
+    Loads the schema and builds the decision engine once per worker, and
+    mirrors the parent's color setting.
+
+    Args:
+        colors_enabled: Whether the parent process uses colored output
+    """
+    global _worker_engine
+
+    if not colors_enabled:
+        Colors.disable()
+
+    _worker_engine = DecisionEngine(SchemaLoader().load())
+
+
+def run_single_test_buffered(test_case: Dict, engine: DecisionEngine, verbose: bool = False,
+                             cache=None) -> Tuple[Dict, str]:
+    """
+    Run a single test case, capturing its report instead of printing it.
+
+    The report's many small prints go to an in-memory buffer, so the
+    caller writes it out in one call (and workers never touch the
+    terminal).
+
+    Args:
+        test_case: Test case dictionary
+        engine: DecisionEngine instance
+        verbose: Whether to print verbose output
+        cache: Optional shelve of previously generated HAR outputs
+
+    Returns:
+        Tuple of (result dictionary, captured output)
+    """
+    buffer = io.StringIO()
+    with redirect_stdout(buffer), redirect_stderr(buffer):
+        result = run_single_test(test_case, engine, verbose=verbose, cache=cache)
+    return result, buffer.getvalue()
+
+
+def _run_single_test_worker(test_case: Dict, verbose: bool) -> Tuple[Dict, str]:
+    """
+    Run a single test case in a worker process.
+
+    Output is buffered rather than printed, so the parent can replay each
+    test's report in order without interleaving.
+
+    Args:
+        test_case: Test case dictionary
+        verbose: Whether to print verbose output
+
+    Returns:
+        Tuple of (result dictionary, captured output)
+    """
+    return run_single_test_buffered(test_case, _worker_engine, verbose=verbose)
+
+
+def run_validation(test_ids: List[str] = None, verbose: bool = False, output_file: str = None,
+                   jobs: int = 1, cache_path: str = None) -> int:
     """
     Run all validation tests.
 
@@ -407,19 +688,14 @@ def run_validation(test_ids: List[str] = None, verbose: bool = False, output_fil
         test_ids: Optional list of specific test IDs to run
         verbose: Whether to print verbose output
         output_file: Optional file path to save detailed results (JSON)
+        jobs: Number of worker processes (1 runs tests in this process)
+        cache_path: Optional shelve file of generated HARs (single-process runs only)
 
     Returns:
         Exit code (0 if all pass, 1 if any fail)
     """
     print_header("HAR Decision Engine Validation Suite", Colors.HEADER)
 
-    # Load schema and create engine
-    print("Loading schema...")
-    loader = SchemaLoader()
-    schema = loader.load()
-    engine = DecisionEngine(schema)
-    print(f"{Colors.OKGREEN}✓ Schema loaded successfully{Colors.ENDC}\n")
-
     # Filter test cases if specific IDs requested
     test_cases = TEST_CASES
     if test_ids:
@@ -428,13 +704,47 @@ def run_validation(test_ids: List[str] = None, verbose: bool = False, output_fil
             print(f"{Colors.FAIL}✗ No test cases found with IDs: {test_ids}{Colors.ENDC}")
             return 1
 
-    print(f"Running {len(test_cases)} test case(s)...\n")
-
-    # Run tests
-    results = []
-    for test_case in test_cases:
-        result = run_single_test(test_case, engine, verbose=verbose)
-        results.append(result)
+    jobs = min(jobs, len(test_cases))
+
+    if jobs > 1:
+        if cache_path:
+            print(f"{Colors.WARNING}⚠ --cache is ignored with multiple workers{Colors.ENDC}")
+        print(f"Running {len(test_cases)} test case(s) on {jobs} workers...\n")
+
+        # Each worker loads the schema once; reports are replayed in order
+        results = []
+        colors_enabled = bool(Colors.ENDC)
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_worker,
+            initargs=(colors_enabled,)
+        ) as executor:
+            for result, output in executor.map(
+                _run_single_test_worker, test_cases, repeat(verbose)
+            ):
+                sys.stdout.write(output)
+                sys.stdout.flush()
+                results.append(result)
+    else:
+        # Load schema and create engine
+        print("Loading schema...")
+        loader = SchemaLoader()
+        schema = loader.load()
+        engine = DecisionEngine(schema)
+        print(f"{Colors.OKGREEN}✓ Schema loaded successfully{Colors.ENDC}\n")
+
+        print(f"Running {len(test_cases)} test case(s)...\n")
+
+        # Run tests
+        results = []
+        with shelve.open(cache_path) if cache_path else nullcontext() as cache:
+            for test_case in test_cases:
+                result, output = run_single_test_buffered(
+                    test_case, engine, verbose=verbose, cache=cache
+                )
+                sys.stdout.write(output)
+                sys.stdout.flush()
+                results.append(result)
 
     # Print summary
     print_header("Validation Summary", Colors.HEADER)
@@ -455,12 +765,11 @@ def run_validation(test_ids: List[str] = None, verbose: bool = False, output_fil
 
     # Save detailed results to file if requested
     if output_file:
-        import json
         output_path = Path(output_file)
 
         # Prepare results for JSON serialization
-        json_results = []
-        for r in results:
+        json_results = [None] * len(results)
+        for i, r in enumerate(results):
             json_result = {
                 'id': r['id'],
                 'name': r['name'],
@@ -476,18 +785,17 @@ def run_validation(test_ids: List[str] = None, verbose: bool = False, output_fil
             if 'missing_phrases' in r:
                 json_result['missing_phrases'] = r['missing_phrases']
 
-            json_results.append(json_result)
+            json_results[i] = json_result
 
-        # Write to file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump({
-                'summary': {
-                    'total': len(results),
-                    'passed': len(passed),
-                    'failed': len(failed)
-                },
-                'results': json_results
-            }, f, indent=2)
+        # Write to file in one call
+        output_path.write_bytes(_dumps_report({
+            'summary': {
+                'total': len(results),
+                'passed': len(passed),
+                'failed': len(failed)
+            },
+            'results': json_results
+        }))
 
         print(f"\n{Colors.OKGREEN}✓ Detailed results saved to: {output_file}{Colors.ENDC}")
 
@@ -511,6 +819,7 @@ Examples:
   python validate_decision_engine.py --verbose      # Run with verbose output
   python validate_decision_engine.py --test-id 24918  # Run specific test
   python validate_decision_engine.py --no-color     # Disable colored output
+  python validate_decision_engine.py --jobs 4       # Run tests in 4 processes
         """
     )
 
@@ -533,12 +842,25 @@ Examples:
         help='Disable colored output'
     )
 
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        help='Run test cases in N worker processes (0 = one per CPU)'
+    )
+
     parser.add_argument(
         '--output', '-o',
         dest='output_file',
         help='Save detailed results to JSON file'
     )
 
+    parser.add_argument(
+        '--cache',
+        dest='cache_path',
+        help='Reuse generated HARs across runs from this cache file'
+    )
+
     args = parser.parse_args()
 
     # Disable colors if requested or not a TTY
@@ -549,7 +871,9 @@ Examples:
     exit_code = run_validation(
         test_ids=args.test_ids,
         verbose=args.verbose,
-        output_file=args.output_file
+        output_file=args.output_file,
+        jobs=args.jobs or os.cpu_count() or 1,
+        cache_path=args.cache_path
     )
 
     sys.exit(exit_code)
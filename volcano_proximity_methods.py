@@ -3,10 +3,119 @@ Volcano proximity-hazard processing methods for decision_engine.py
 
 Add these methods to the DecisionEngine class in src/pipeline/decision_engine.py
 Insert after line 484 (after _get_ashfall_statement method)
+
+Schema rules are read from the attributes DecisionEngine.__init__ resolves
+once (self._rule_pdz, self._rule_lahar, ...), not looked up per call, and
+rule-text hazards reuse the sections' text prebuilt in self._hazard_exp_recs.
+Constants and fixed statements shared with the engine (_DISTANCE_SAFE_KM,
+_DISTANCE_SAFE_STATEMENT, _build_nearest_statement, ...) are imported from
+decision_engine.py rather than redefined, so the two cannot drift apart.
 """
 
 import re
-from typing import Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from src.models import (
+    Assessment,
+    AssessmentCategory,
+    ExplanationRecommendation,
+    HAROutput,
+    HARSection,
+)
+from src.pipeline.decision_engine import (
+    _BALLISTIC_SPEC,
+    _BASE_SURGE_SPEC,
+    _DISTANCE_SAFE_KM,
+    _DISTANCE_SAFE_STATEMENT,
+    _EMPTY_STATUSES,
+    _HAZARD_SPECS,
+    _LAVA_FLOW_SPEC,
+    _PDC_SPEC,
+    _ZONE_RE,
+    HazardSpec,
+    _build_nearest_statement,
+    _canonical_volcano_name,
+)
+
+
+# PDZ radii (km) for known volcanoes, keyed by canonical name (see
+# DecisionEngine._parse_nearest_volcano)
+_PDZ_RADII = {
+    'taal': 4.0,
+    'kanlaon': 4.0,
+    'mayon': 6.0,
+    'pinatubo': 4.0,
+    'bulusan': 4.0,
+    'hibok-hibok': 4.0
+}
+
+# Lowercased hazard statuses that call for avoidance...
+_PRONE_RE = re.compile(r'prone|highly|moderately|within buffer|inside pdz|within pdz|zone [1-3]')
+# ...unless they are "least prone" or "safe"
+_SAFE_RE = re.compile(r'least prone|safe')
+
+
+@lru_cache(maxsize=256)
+def _is_prone_status(status: str) -> bool:
+    """
+    Whether a hazard status calls for avoidance (cached per status).
+    
+    Repeated statuses ("Prone", "Highly Prone", "--", ...) skip both
+    regex scans after their first lookup.
+    
+    Args:
+        status: Hazard status text (e.g. "Prone; Highly Prone")
+        
+    Returns:
+        True if a prone keyword is present, but not "least prone" or "safe"
+    """
+    status_lower = status.lower()
+    return bool(_PRONE_RE.search(status_lower)) and not _SAFE_RE.search(status_lower)
+
+
+@lru_cache(maxsize=64)
+def _pdz_text(volcano_name: str, pdz_radius: float, condition_key: str,
+              rule_exp: Optional[str], rule_rec: Optional[str]) -> Tuple[str, Optional[str], Optional[str]]:
+    """
+    Build PDZ status, explanation and recommendation text (cached).
+    
+    Only a dozen or so (volcano, radius, condition) combinations occur, so
+    each is formatted once.
+    
+    Args:
+        volcano_name: Name of volcano
+        pdz_radius: PDZ radius in km
+        condition_key: "within_pdz" or "outside_pdz"
+        rule_exp: PDZ rule explanation
+        rule_rec: PDZ rule recommendation
+        
+    Returns:
+        Tuple of (status, explanation, recommendation)
+    """
+    if condition_key == "within_pdz":
+        status = f"Within PDZ; The site is within the {pdz_radius}-kilometer radius Permanent Danger Zone"
+        return status, rule_exp, rule_rec
+    
+    # For sites outside PDZ, use simpler explanation ending with the status
+    status = f"Outside PDZ; The site is outside the {pdz_radius}-kilometer radius Permanent Danger Zone"
+    explanation = (
+        f"The Permanent Danger Zone (PDZ) is a zone that can always be affected by small-scale "
+        f"eruptions of {volcano_name} Volcano. Human settlement is not recommended within the PDZ. "
+        f"The site is outside the {pdz_radius}-kilometer radius Permanent Danger Zone of the volcano."
+    )
+    return status, explanation, None
+
+
+@lru_cache(maxsize=1)
+def _avoidance_statement() -> ExplanationRecommendation:
+    """General avoidance recommendation, built once on first use."""
+    return ExplanationRecommendation.from_parts(
+        explanation=(
+            "Avoidance is recommended for sites that may potentially be affected by "
+            "primary volcanic hazards, especially pyroclastic density currents and lava flows."
+        )
+    )
 
 
 # ============================================================================
@@ -35,59 +144,29 @@ def _process_pdz(self, assessment: Assessment, volcano_name: str) -> Optional[HA
     # Note: OHAS doesn't have a separate PDZ column currently,
     # so we check proximity and infer from other hazard statuses
     
-    rule = self.schema.volcano_rules.get('pdz_danger_zone')
+    rule = self._rule_pdz
     if not rule:
         return None
     
-    # Extract distance from nearest volcano text
-    distance_km = self._parse_nearest_volcano(assessment).get('distance', 0.0)
-    volcano_lower = volcano_name.lower()
-    
-    # Define PDZ radii for known volcanoes
-    pdz_radii = {
-        'taal': 4.0,
-        'kanlaon': 4.0,
-        'mayon': 6.0,
-        'pinatubo': 4.0,
-        'bulusan': 4.0,
-        'hibok-hibok': 4.0
-    }
+    # Extract distance and canonical name from nearest volcano text
+    volcano_info = self._parse_nearest_volcano(assessment)
+    distance_km = volcano_info.get('distance', 0.0)
     
     # Check if this volcano has a PDZ
-    pdz_radius = None
-    for volcano_key, radius in pdz_radii.items():
-        if volcano_key in volcano_lower:
-            pdz_radius = radius
-            break
+    pdz_radius = _PDZ_RADII.get(volcano_info.get('canonical'))
     
     if pdz_radius is None:
         return None  # No PDZ for this volcano
     
     # Determine status based on distance
-    if distance_km < pdz_radius:
-        status = f"Within PDZ; The site is within the {pdz_radius}-kilometer radius Permanent Danger Zone"
-        condition_key = "within_pdz"
-    else:
-        status = f"Outside PDZ; The site is outside the {pdz_radius}-kilometer radius Permanent Danger Zone"
-        condition_key = "outside_pdz"
-    
-    # Get explanation and recommendation
-    explanation = rule.explanation
-    recommendation = rule.recommendation
-    
-    # For sites outside PDZ, use simpler recommendation
-    if condition_key == "outside_pdz":
-        explanation = f"The Permanent Danger Zone (PDZ) is a zone that can always be affected by small-scale eruptions of {volcano_name} Volcano. Human settlement is not recommended within the PDZ."
-        recommendation = f"The site is outside the {pdz_radius}-kilometer radius Permanent Danger Zone of the volcano."
-        
-        exp_rec = ExplanationRecommendation.from_parts(
-            explanation=explanation + " " + recommendation
-        )
-    else:
-        exp_rec = ExplanationRecommendation.from_parts(
-            explanation=explanation,
-            recommendation=recommendation
-        )
+    condition_key = "within_pdz" if distance_km < pdz_radius else "outside_pdz"
+    status, explanation, recommendation = _pdz_text(
+        volcano_name, pdz_radius, condition_key, rule.explanation, rule.recommendation
+    )
+    exp_rec = ExplanationRecommendation.from_parts(
+        explanation=explanation,
+        recommendation=recommendation
+    )
     
     return HARSection(
         heading="PDZ (Permanent Danger Zone)",
@@ -96,7 +175,8 @@ def _process_pdz(self, assessment: Assessment, volcano_name: str) -> Optional[HA
     )
 
 
-def _process_lahar(self, assessment: Assessment, volcano_name: str) -> Optional[HARSection]:
+def _process_lahar(self, assessment: Assessment, volcano_name: str,
+                   canonical: Optional[str] = None) -> Optional[HARSection]:
     """
     Process lahar hazard assessment.
     
@@ -108,6 +188,7 @@ def _process_lahar(self, assessment: Assessment, volcano_name: str) -> Optional[
     Args:
         assessment: Volcano assessment data
         volcano_name: Name of volcano
+        canonical: Canonical volcano name (e.g. "mayon"), if the caller already has it
         
     Returns:
         HARSection for lahar or None if not assessed
@@ -117,19 +198,23 @@ def _process_lahar(self, assessment: Assessment, volcano_name: str) -> Optional[
     if not lahar_status or lahar_status == "--":
         return None  # Not assessed
     
-    rule = self.schema.volcano_rules.get('lahar')
+    rule = self._rule_lahar
     if not rule:
         return None
     
-    volcano_lower = volcano_name.lower()
+    if canonical is None:
+        canonical = _canonical_volcano_name(volcano_name)
     
     # Get base explanation and recommendation
     explanation = rule.explanation
     recommendation = rule.recommendation
     
     # Special case: Pinatubo zones
-    if "pinatubo" in volcano_lower:
-        zone_match = re.search(r"zone\s+([1-5])", lahar_status, re.IGNORECASE)
+    if canonical == "pinatubo":
+        # Only statuses mentioning a zone need the regex
+        zone_match = None
+        if "zone" in lahar_status.lower():
+            zone_match = _ZONE_RE.search(lahar_status)
         if zone_match and rule.special_cases:
             zone_num = zone_match.group(1)
             pinatubo_zones = rule.special_cases.get('pinatubo_zones', {})
@@ -140,7 +225,7 @@ def _process_lahar(self, assessment: Assessment, volcano_name: str) -> Optional[
                 explanation = zone_data['explanation']
     
     # Special case: Mayon prone levels
-    elif "mayon" in volcano_lower:
+    elif canonical == "mayon":
         # Mayon has specific prone level classifications
         # but explanation and recommendation are same for all levels
         pass  # Use standard explanation and recommendation
@@ -160,156 +245,53 @@ def _process_lahar(self, assessment: Assessment, volcano_name: str) -> Optional[
     )
 
 
-def _process_pyroclastic_flow(self, assessment: Assessment) -> Optional[HARSection]:
+def _process_simple_hazard(self, assessment: Assessment, spec: HazardSpec) -> Optional[HARSection]:
     """
-    Process pyroclastic flow/PDC hazard assessment.
+    Process a hazard whose section is its schema rule text.
     
     Args:
         assessment: Volcano assessment data
+        spec: Which hazard to process (entry of the engine's _HAZARD_SPECS)
         
     Returns:
-        HARSection for PDC or None if not assessed
+        HARSection for the hazard or None if not assessed
     """
-    pdc_status = assessment.volcano.pyroclastic_flow
+    status = getattr(assessment.volcano, spec.attr)
     
-    if not pdc_status or pdc_status == "--":
+    # Skip if not assessed, or if Safe (usually not shown in HAR for Safe status)
+    if status in _EMPTY_STATUSES or spec.is_safe(status):
         return None
     
-    rule = self.schema.volcano_rules.get('pyroclastic_density_current')
-    if not rule:
+    # Built once per rule in DecisionEngine.__init__
+    exp_rec = self._hazard_exp_recs.get(spec.rule_attr)
+    if exp_rec is None:
         return None
     
-    # Get explanation and recommendation
-    explanation = rule.explanation
-    recommendation = rule.recommendation
-    
-    exp_rec = ExplanationRecommendation.from_parts(
-        explanation=explanation,
-        recommendation=recommendation
-    )
-    
     return HARSection(
-        heading="Pyroclastic Density Current",
-        assessment=pdc_status,
+        heading=spec.heading,
+        assessment=status,
         explanation_recommendation=exp_rec
     )
 
 
+def _process_pyroclastic_flow(self, assessment: Assessment) -> Optional[HARSection]:
+    """Process pyroclastic flow/PDC hazard assessment."""
+    return self._process_simple_hazard(assessment, _PDC_SPEC)
+
+
 def _process_lava_flow(self, assessment: Assessment) -> Optional[HARSection]:
-    """
-    Process lava flow hazard assessment.
-    
-    Args:
-        assessment: Volcano assessment data
-        
-    Returns:
-        HARSection for lava flow or None if not assessed
-    """
-    lava_status = assessment.volcano.lava_flow
-    
-    if not lava_status or lava_status == "--":
-        return None
-    
-    # Skip if Safe (usually not shown in HAR for Safe status)
-    if "safe" in lava_status.lower():
-        return None
-    
-    rule = self.schema.volcano_rules.get('lava_flow')
-    if not rule:
-        return None
-    
-    # Get explanation and recommendation
-    explanation = rule.explanation
-    recommendation = rule.recommendation
-    
-    exp_rec = ExplanationRecommendation.from_parts(
-        explanation=explanation,
-        recommendation=recommendation
-    )
-    
-    return HARSection(
-        heading="Lava Flow",
-        assessment=lava_status,
-        explanation_recommendation=exp_rec
-    )
+    """Process lava flow hazard assessment."""
+    return self._process_simple_hazard(assessment, _LAVA_FLOW_SPEC)
 
 
 def _process_ballistic_projectiles(self, assessment: Assessment) -> Optional[HARSection]:
-    """
-    Process ballistic projectiles hazard assessment.
-    
-    Args:
-        assessment: Volcano assessment data
-        
-    Returns:
-        HARSection for ballistic projectiles or None if not assessed
-    """
-    ballistic_status = assessment.volcano.ballistic_projectile
-    
-    if not ballistic_status or ballistic_status == "--":
-        return None
-    
-    # Skip if Safe
-    if "safe" in ballistic_status.lower():
-        return None
-    
-    rule = self.schema.volcano_rules.get('ballistic_projectiles')
-    if not rule:
-        return None
-    
-    # Get explanation and recommendation
-    explanation = rule.explanation
-    recommendation = rule.recommendation
-    
-    exp_rec = ExplanationRecommendation.from_parts(
-        explanation=explanation,
-        recommendation=recommendation
-    )
-    
-    return HARSection(
-        heading="Ballistic Projectiles",
-        assessment=ballistic_status,
-        explanation_recommendation=exp_rec
-    )
+    """Process ballistic projectiles hazard assessment."""
+    return self._process_simple_hazard(assessment, _BALLISTIC_SPEC)
 
 
 def _process_base_surge(self, assessment: Assessment) -> Optional[HARSection]:
-    """
-    Process base surge hazard assessment (Taal-specific).
-    
-    Args:
-        assessment: Volcano assessment data
-        
-    Returns:
-        HARSection for base surge or None if not assessed
-    """
-    base_surge_status = assessment.volcano.base_surge
-    
-    if not base_surge_status or base_surge_status == "--":
-        return None
-    
-    # Skip if Safe
-    if "safe" in base_surge_status.lower():
-        return None
-    
-    rule = self.schema.volcano_rules.get('base_surge')
-    if not rule:
-        return None
-    
-    # Get explanation and recommendation
-    explanation = rule.explanation
-    recommendation = rule.recommendation
-    
-    exp_rec = ExplanationRecommendation.from_parts(
-        explanation=explanation,
-        recommendation=recommendation
-    )
-    
-    return HARSection(
-        heading="Base Surge",
-        assessment=base_surge_status,
-        explanation_recommendation=exp_rec
-    )
+    """Process base surge hazard assessment (Taal-specific)."""
+    return self._process_simple_hazard(assessment, _BASE_SURGE_SPEC)
 
 
 def _check_needs_avoidance(self, assessment: Assessment) -> bool:
@@ -326,29 +308,34 @@ def _check_needs_avoidance(self, assessment: Assessment) -> bool:
     """
     volcano = assessment.volcano
     
-    # Keywords that indicate hazardous status
-    prone_keywords = ["prone", "highly", "moderately", "within buffer", 
-                     "inside pdz", "within pdz", "zone 1", "zone 2", "zone 3"]
-    
-    # Check all proximity hazards
+    # Check all proximity hazards, most often prone first (lahar, then PDC),
+    # the same order as DecisionEngine's _AVOIDANCE_FLAGS
     hazard_fields = [
         volcano.lahar,
         volcano.pyroclastic_flow,
         volcano.lava_flow,
-        volcano.base_surge,
-        volcano.ballistic_projectile
+        volcano.ballistic_projectile,
+        volcano.base_surge
     ]
     
-    for field in hazard_fields:
-        if field:
-            field_lower = field.lower()
-            # Check if any prone keyword is in the status
-            if any(keyword in field_lower for keyword in prone_keywords):
-                # But not if it's "least prone" or "safe"
-                if "least prone" not in field_lower and "safe" not in field_lower:
-                    return True
+    return any(field and _is_prone_status(field) for field in hazard_fields)
+
+
+def _check_distance_based_safety(self, assessment: Assessment, distance_km: float) -> bool:
+    """
+    Check if the site is far enough from the volcano to be safe.
+    
+    Sites beyond _DISTANCE_SAFE_KM get the distance-based safety statement
+    instead of individual proximity-hazard sections.
     
-    return False
+    Args:
+        assessment: Volcano assessment data
+        distance_km: Distance to the nearest active volcano in km
+        
+    Returns:
+        True if the site is distance-safe
+    """
+    return distance_km > _DISTANCE_SAFE_KM
 
 
 def _get_avoidance_recommendation(self) -> ExplanationRecommendation:
@@ -360,12 +347,7 @@ def _get_avoidance_recommendation(self) -> ExplanationRecommendation:
     Returns:
         ExplanationRecommendation with avoidance text
     """
-    text = (
-        "Avoidance is recommended for sites that may potentially be affected by "
-        "primary volcanic hazards, especially pyroclastic density currents and lava flows."
-    )
-    
-    return ExplanationRecommendation.from_parts(explanation=text)
+    return _avoidance_statement()
 
 
 # ============================================================================
@@ -411,27 +393,18 @@ def process_volcano_assessment_UPDATED(self, assessment: Assessment) -> HAROutpu
     # 2. Parse volcano information and add nearest volcano statement
     volcano_info = self._parse_nearest_volcano(assessment)
     volcano_name = volcano_info.get('name', 'Unknown')
+    canonical = volcano_info.get('canonical')
     distance_km = volcano_info.get('distance', 0.0)
     
     # Add "X Volcano is the nearest identified active volcano to the site."
     if volcano_name != 'Unknown':
-        nearest_statement = ExplanationRecommendation.from_parts(
-            explanation=f"{volcano_name} Volcano is the nearest identified active volcano to the site."
-        )
-        common.append(nearest_statement)
+        common.append(_build_nearest_statement(volcano_name))
     
     # 3. Distance-based safety statement
     is_distance_safe = self._check_distance_based_safety(assessment, distance_km)
     
     if is_distance_safe:
-        safety_statement = ExplanationRecommendation.from_parts(
-            explanation=(
-                f"Considering the distance of the site from the volcano, the site is safe from "
-                f"volcanic hazards such as pyroclastic density currents, lava flows, and ballistic "
-                f"projectiles that may originate from the volcano."
-            )
-        )
-        common.append(safety_statement)
+        common.append(_DISTANCE_SAFE_STATEMENT)
     
     # 4-9. Process individual hazards (ONLY if not distance-safe)
     if not is_distance_safe:
@@ -441,30 +414,19 @@ def process_volcano_assessment_UPDATED(self, assessment: Assessment) -> HAROutpu
             sections.append(pdz_section)
         
         # Lahar (with special cases for Pinatubo zones and Mayon prone levels)
-        lahar_section = self._process_lahar(assessment, volcano_name)
+        lahar_section = self._process_lahar(assessment, volcano_name, canonical)
         if lahar_section:
             sections.append(lahar_section)
         
-        # Pyroclastic Flow
-        pdc_section = self._process_pyroclastic_flow(assessment)
-        if pdc_section:
-            sections.append(pdc_section)
-        
-        # Lava Flow
-        lava_section = self._process_lava_flow(assessment)
-        if lava_section:
-            sections.append(lava_section)
-        
-        # Ballistic Projectiles (if assessed)
-        ballistic_section = self._process_ballistic_projectiles(assessment)
-        if ballistic_section:
-            sections.append(ballistic_section)
-        
-        # Base Surge (Taal only)
-        if "taal" in volcano_name.lower():
-            base_surge_section = self._process_base_surge(assessment)
-            if base_surge_section:
-                sections.append(base_surge_section)
+        # Pyroclastic Flow, Lava Flow, Ballistic Projectiles (if assessed),
+        # Base Surge (Taal only) and Volcanic Tsunami, from the engine's table
+        is_taal = canonical == "taal"
+        for spec in _HAZARD_SPECS:
+            if spec.taal_only and not is_taal:
+                continue
+            section = self._process_simple_hazard(assessment, spec)
+            if section:
+                sections.append(section)
     
     # 10. PAV (Potentially Active Volcano) - skip if we have nearby active volcano
     # Real HARs prioritize nearest AV over distant PAV